@@ -1,20 +1,26 @@
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
+import hashlib
+import hmac
 import os
+import threading
+import time
 from dotenv import load_dotenv
 
+from password_pool import pwd_context
+
 load_dotenv()
 
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-this")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("TOKEN_CACHE_MAX_ENTRIES", "1024"))
 
-pwd_context = CryptContext(schemes=["bcrypt_sha256", "bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/admin/login", auto_error=False)
 
 def verify_password(plain_password, hashed_password):
@@ -33,16 +39,83 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+class VerifiedTokenCache:
+    """
+    Bounded cache of tokens that already passed jwt.decode.
+
+    Entries are keyed by an HMAC of the token under the current SECRET_KEY
+    and algorithm, so rotating the key makes every cached entry unreachable
+    and tokens are verified again against the new key. Each entry expires at
+    its token's own `exp`; only the subject is kept, never the token.
+    """
+
+    def __init__(self, max_entries: int = TOKEN_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # digest -> (exp, username)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hmac.new(f"{ALGORITHM}:{SECRET_KEY}".encode(), token.encode(), hashlib.sha256).digest()
+
+    def get(self, digest: bytes) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None and entry[0] > time.time():
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[digest]
+            self.misses += 1
+            return None
+
+    def set(self, digest: bytes, exp: float, username: str):
+        with self._lock:
+            self._entries[digest] = (exp, username)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+token_cache = VerifiedTokenCache()
+
 def verify_token(token: str, credentials_exception):
+    digest = token_cache.digest(token)
+    username = token_cache.get(digest)
+    if username is not None:
+        return username
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
-        return username
     except JWTError:
         raise credentials_exception
 
+    # Tokens without an expiry are verified every time
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        token_cache.set(digest, exp, username)
+    return username
+
 async def get_current_admin(request: Request, token: str = Depends(oauth2_scheme)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Compare the sync and async database stacks under concurrent load
+
+Seeds a throwaway database, then drives the public read routes in-process
+through httpx's ASGI transport at increasing concurrency, once with
+DATABASE_ASYNC=false (sync routes on Starlette's threadpool, 40 threads by
+default) and once with DATABASE_ASYNC=true. Each mode runs in its own
+subprocess so the engines never share a process. The response cache is
+disabled so every request reaches the database.
+
+Usage (from the backend directory):
+  python benchmarks/async_load.py [requests per level] [concurrency ...]
+
+Set BENCH_DATABASE_URL to run against an empty PostgreSQL database instead
+of a temporary SQLite file; that is where the difference shows, since
+SQLite answers faster than a thread switch. Needs httpx.
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROUTES = ["/api/blogs?limit=20", "/api/blogs/post-7", "/api/projects", "/api/portfolio"]
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+def seed():
+    import models
+    from database import engine
+
+    models.Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(models.Blog.__table__.insert(), [
+            {"title": f"Post {i}", "slug": f"post-{i}", "content": "lorem ipsum " * 200,
+             "excerpt": "lorem ipsum", "published": True, "tags": "python, fastapi", "views": 0}
+            for i in range(200)
+        ])
+        connection.execute(models.Project.__table__.insert(), [
+            {"title": f"Project {i}", "description": "lorem ipsum", "featured": i % 3 == 0, "order_index": i}
+            for i in range(30)
+        ])
+
+async def drive(total, concurrency):
+    import httpx
+    from main import app
+
+    timings = []
+    queue = asyncio.Queue()
+    for i in range(total):
+        queue.put_nowait(ROUTES[i % len(ROUTES)])
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            while not queue.empty():
+                path = queue.get_nowait()
+                started = time.perf_counter()
+                response = await client.get(path)
+                timings.append((time.perf_counter() - started) * 1000)
+                if response.status_code != 200:
+                    raise SystemExit(f"✗ {path} returned {response.status_code}")
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "concurrency": concurrency,
+        "rps": round(total / elapsed, 1),
+        "p50_ms": round(percentile(timings, 50), 2),
+        "p95_ms": round(percentile(timings, 95), 2),
+    }
+
+def run_mode(total, levels):
+    # Child process: DATABASE_URL and DATABASE_ASYNC are already set
+    sys.path.insert(0, BACKEND)
+    if os.environ.get("BENCH_SEED") == "1":
+        seed()
+        return
+    results = []
+    for concurrency in levels:
+        asyncio.run(drive(min(total, concurrency * 5), concurrency))  # warm up
+        results.append(asyncio.run(drive(total, concurrency)))
+    print(json.dumps(results))
+
+def spawn(env, args):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--mode", *args],
+        env=env, cwd=BACKEND, check=True, stdout=subprocess.PIPE, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1]) if output.strip() else None
+
+def run(total=2000, levels=(10, 40, 100, 200)):
+    env = dict(os.environ, RESPONSE_CACHE_TTL="0")
+    env["DATABASE_URL"] = os.environ.get(
+        "BENCH_DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+    spawn(dict(env, BENCH_SEED="1", DATABASE_ASYNC="false"), [str(total)])
+    print(f"✓ Seeded {env['DATABASE_URL'].split(':', 1)[0]} database")
+
+    args = [str(total), *map(str, levels)]
+    reports = {mode: spawn(dict(env, DATABASE_ASYNC=flag), args)
+               for mode, flag in (("sync", "false"), ("async", "true"))}
+
+    print(f"\n{total} requests per level over {len(ROUTES)} public routes")
+    print("-" * 66)
+    print(f"{'concurrency':>11}  {'sync rps':>9} {'p50':>8} {'p95':>8}  {'async rps':>9} {'p50':>8} {'p95':>8}")
+    for sync, asyn in zip(reports["sync"], reports["async"]):
+        print(f"{sync['concurrency']:>11}  {sync['rps']:>9} {sync['p50_ms']:>8} {sync['p95_ms']:>8}"
+              f"  {asyn['rps']:>9} {asyn['p50_ms']:>8} {asyn['p95_ms']:>8}")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--mode":
+        run_mode(int(sys.argv[2]), [int(level) for level in sys.argv[3:]])
+    else:
+        run(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+            [int(level) for level in sys.argv[2:]] or (10, 40, 100, 200),
+        )
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Count the SQL statements issued per blog detail request
+
+Compares the old read path (lookup by slug, lookup by id, update, commit,
+refresh) with the current GET /api/blogs/{slug} handler.
+
+Usage (from the backend directory):
+  python benchmarks/blog_detail_queries.py [requests]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Run against a throwaway SQLite database unless one is given explicitly
+if "BENCH_DATABASE_URL" in os.environ:
+    os.environ["DATABASE_URL"] = os.environ["BENCH_DATABASE_URL"]
+else:
+    os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db")
+
+from sqlalchemy import event
+
+import crud
+import main
+import models
+import schemas
+from blog_views import blog_view_counter
+from cache import response_cache
+from database import DbRunner, SessionLocal, engine
+
+statements = 0
+
+@event.listens_for(engine, "before_cursor_execute")
+def count_statement(conn, cursor, statement, parameters, context, executemany):
+    global statements
+    statements += 1
+
+def legacy_blog_detail(db, slug):
+    """The blog detail path before view counting was deferred"""
+    blog = crud.get_blog_by_slug(db, slug)
+    db_blog = db.query(models.Blog).filter(models.Blog.id == blog.id).first()
+    db_blog.views += 1
+    db.commit()
+    db.refresh(db_blog)
+    return db_blog
+
+def current_blog_detail(db, slug):
+    """The GET /api/blogs/{slug} handler"""
+    return asyncio.run(main.get_blog_by_slug(slug, DbRunner(db)))
+
+def measure(label, handler, requests):
+    global statements
+    statements = 0
+    for _ in range(requests):
+        db = SessionLocal()
+        try:
+            handler(db)
+        finally:
+            db.close()
+    per_request = statements / requests
+    print(f"{label:<10} {statements:>6} statements  {per_request:>6.2f} per request")
+    return per_request
+
+def main_benchmark(requests=1000):
+    models.Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    crud.create_blog(db, schemas.BlogCreate(
+        title="Benchmark post", slug="benchmark-post", content="Lorem ipsum " * 500, published=True
+    ))
+    db.close()
+
+    print(f"Blog detail statements over {requests} requests")
+    print("-" * 50)
+    before = measure("before", lambda db: legacy_blog_detail(db, "benchmark-post"), requests)
+    cold = measure("after/miss", lambda db: (response_cache.clear(), current_blog_detail(db, "benchmark-post")), requests)
+    after = measure("after/hit", lambda db: current_blog_detail(db, "benchmark-post"), requests)
+
+    global statements
+    statements = 0
+    blog_view_counter.flush()
+    print(f"{'flush':<10} {statements:>6} statements  (one batch for {requests} views)")
+    print("-" * 50)
+    print(f"before: {before:.2f}  after (cache miss): {cold:.2f}  after (cache hit): {after:.2f} statements/request")
+
+if __name__ == "__main__":
+    main_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Measure blog search latency on a synthetic corpus
+
+Seeds a throwaway database with published posts built from a fixed
+vocabulary, then times crud.search_blogs for random one- and two-word
+queries and reports p50/p95/p99.
+
+Usage (from the backend directory):
+  python benchmarks/blog_search_latency.py [posts] [queries]
+
+Set BENCH_DATABASE_URL to run against an empty PostgreSQL database instead
+of a temporary SQLite file.
+"""
+
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+if "BENCH_DATABASE_URL" in os.environ:
+    os.environ["DATABASE_URL"] = os.environ["BENCH_DATABASE_URL"]
+else:
+    os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db")
+
+import crud
+import models
+from database import SessionLocal, engine
+
+TOPICS = [
+    "python", "fastapi", "react", "postgres", "sqlite", "docker", "kubernetes", "rust",
+    "async", "caching", "testing", "security", "machine", "learning", "vector", "index",
+]
+
+def build_vocabulary(rng, size=5000):
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(letters) for _ in range(rng.randint(4, 9))))
+    return sorted(words) + TOPICS
+
+def seed(posts, rng, vocabulary, batch_size=5000):
+    blog = models.Blog.__table__
+    with engine.begin() as connection:
+        for start in range(0, posts, batch_size):
+            rows = []
+            for i in range(start, min(start + batch_size, posts)):
+                rows.append({
+                    "title": " ".join(rng.choices(vocabulary, k=6)),
+                    "slug": f"post-{i}",
+                    "excerpt": " ".join(rng.choices(vocabulary, k=20)),
+                    "content": " ".join(rng.choices(vocabulary, k=300)),
+                    "published": True,
+                    "tags": ", ".join(rng.sample(TOPICS, 3)),
+                    "views": 0,
+                })
+            connection.execute(blog.insert(), rows)
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+def run(posts=100_000, queries=500):
+    rng = random.Random(42)
+    vocabulary = build_vocabulary(rng)
+    models.Base.metadata.create_all(bind=engine)
+
+    print(f"Seeding {posts} posts ({engine.dialect.name})...")
+    started = time.perf_counter()
+    seed(posts, rng, vocabulary)
+    print(f"✓ Seeded in {time.perf_counter() - started:.1f}s")
+
+    db = SessionLocal()
+    timings = []
+    hits = 0
+    try:
+        for _ in range(queries):
+            words = rng.sample(vocabulary, rng.choice([1, 2]))
+            started = time.perf_counter()
+            results = crud.search_blogs(db, " ".join(words), limit=20)
+            timings.append((time.perf_counter() - started) * 1000)
+            hits += len(results)
+    finally:
+        db.close()
+
+    print(f"\nSearch latency over {queries} queries (limit 20)")
+    print("-" * 50)
+    print(f"p50  {percentile(timings, 50):8.2f} ms")
+    print(f"p95  {percentile(timings, 95):8.2f} ms")
+    print(f"p99  {percentile(timings, 99):8.2f} ms")
+    print(f"mean {statistics.mean(timings):8.2f} ms  ({hits / queries:.1f} results/query)")
+
+if __name__ == "__main__":
+    run(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 500,
+    )
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Measure API cold-start time with and without FAST_STARTUP
+
+Boots the app in a fresh interpreter the way a new worker would: import
+main, then run the startup handlers. Reports the wall time until ready and
+the number of SQL statements and connections opened on the way, as the
+median over several runs. The database is migrated and the admin exists
+before timing starts, which is the steady state of a redeploy.
+
+Usage (from the backend directory):
+  python benchmarks/cold_start.py [runs]
+
+Set BENCH_DATABASE_URL to boot against PostgreSQL instead of a temporary
+SQLite file; every round-trip then costs real network latency.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in the child interpreter
+BOOT = """
+import time
+started = time.perf_counter()
+import asyncio
+from sqlalchemy import event
+import database
+
+statements = []
+event.listen(database.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+import main
+imported = time.perf_counter()
+asyncio.run(main.app.router.startup())
+ready = time.perf_counter()
+print(__import__("json").dumps({
+    "import_ms": (imported - started) * 1000,
+    "ready_ms": (ready - started) * 1000,
+    "statements": len(statements),
+    "connections": database.pool_monitors["sync"].connects,
+}))
+asyncio.run(main.app.router.shutdown())
+"""
+
+def boot(env):
+    started = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", BOOT], env=env, cwd=BACKEND,
+        check=True, stdout=subprocess.PIPE, text=True,
+    ).stdout
+    report = json.loads(output.strip().splitlines()[-1])
+    report["process_ms"] = (time.perf_counter() - started) * 1000
+    return report
+
+def run(runs=5):
+    env = dict(os.environ, ADMIN_USERNAME="bench-admin", ADMIN_PASSWORD="Bench!Passw0rd-123")
+    env["DATABASE_URL"] = os.environ.get(
+        "BENCH_DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+    # Migrate and bootstrap once, as a deployment would before scaling out
+    subprocess.run([sys.executable, "-m", "alembic", "upgrade", "head"], env=env, cwd=BACKEND,
+                   check=True, capture_output=True)
+    subprocess.run([sys.executable, "bootstrap_admin.py"], env=env, cwd=BACKEND,
+                   check=True, capture_output=True)
+    print("✓ Database migrated and admin bootstrapped")
+
+    print(f"\nCold start, median of {runs} runs")
+    print("-" * 70)
+    print(f"{'mode':<14} {'import':>9} {'ready':>9} {'process':>9} {'statements':>11} {'connections':>12}")
+    for mode, flag in (("default", "false"), ("FAST_STARTUP", "true")):
+        reports = [boot(dict(env, FAST_STARTUP=flag)) for _ in range(runs)]
+        median = {key: statistics.median(report[key] for report in reports) for key in reports[0]}
+        print(f"{mode:<14} {median['import_ms']:>7.0f}ms {median['ready_ms']:>7.0f}ms "
+              f"{median['process_ms']:>7.0f}ms {median['statements']:>11.0f} {median['connections']:>12.0f}")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Reproducible load and latency benchmark for the API
+
+Boots the FastAPI app in-process against a freshly seeded database, drives
+each scenario below at a fixed concurrency through httpx's ASGI transport
+and writes throughput plus p50/p95/p99 latency per scenario to a JSON
+report. Seed data and request order come from a fixed random seed, so two
+reports from different commits can be compared directly.
+
+Usage (from the backend directory):
+  python benchmarks/load_suite.py [--requests N] [--concurrency N] [--output FILE]
+  python benchmarks/load_suite.py --compare before.json after.json
+
+Runs against a temporary SQLite file; set BENCH_DATABASE_URL to an empty
+PostgreSQL database to benchmark that as well. The rate limiter is turned
+off for the run and the response cache stays on unless --no-cache is given.
+Needs httpx.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADMIN_USERNAME = "bench-admin"
+ADMIN_PASSWORD = "Bench!Passw0rd-123"
+SEED = 42
+BLOGS = 300
+TAGS = ["python", "fastapi", "react", "postgres", "docker", "testing", "security", "async"]
+
+def public_data_paths(rng):
+    return rng.choice([
+        "/api/portfolio", "/api/about", "/api/stack", "/api/projects", "/api/projects?featured=true",
+        "/api/experience", "/api/education", "/api/social-links",
+    ])
+
+# name -> (method, request builder, needs admin token)
+SCENARIOS = {
+    "public_data": ("GET", lambda rng, i: public_data_paths(rng), False),
+    "blog_list": ("GET", lambda rng, i: rng.choice(["/api/blogs", "/api/blogs?limit=50", f"/api/blogs?tag={rng.choice(TAGS)}"]), False),
+    "blog_detail": ("GET", lambda rng, i: f"/api/blogs/post-{rng.randrange(BLOGS)}", False),
+    "contact_submit": ("POST", lambda rng, i: ("/api/contact", {
+        "name": f"Visitor {i}", "email": f"visitor{i}@example.com",
+        "subject": "Benchmark", "message": "Hello, this is a benchmark message.",
+    }), False),
+    "admin_blogs": ("GET", lambda rng, i: rng.choice(["/api/admin/blogs", f"/api/admin/blogs/{rng.randrange(BLOGS) + 1}"]), True),
+    "admin_contacts": ("GET", lambda rng, i: "/api/admin/contacts", True),
+    "admin_update_stack": ("PUT", lambda rng, i: (f"/api/admin/stack/{rng.randrange(10) + 1}", {"proficiency": rng.randrange(50, 100)}), True),
+}
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+def seed_database():
+    import crud
+    import models
+    from auth import get_password_hash
+    from database import SessionLocal, engine
+
+    rng = random.Random(SEED)
+    models.Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(models.About.__table__.insert(), [{"title": "Benchmark", "description": "Seeded profile"}])
+        connection.execute(models.Stack.__table__.insert(), [
+            {"name": f"Tool {i}", "category": rng.choice(["Frontend", "Backend"]), "proficiency": rng.randrange(50, 100), "order_index": i}
+            for i in range(10)
+        ])
+        connection.execute(models.Project.__table__.insert(), [
+            {"title": f"Project {i}", "description": "lorem ipsum " * 20, "featured": i % 3 == 0, "order_index": i}
+            for i in range(30)
+        ])
+        connection.execute(models.Experience.__table__.insert(), [
+            {"company": f"Company {i}", "position": "Engineer", "start_date": f"20{10 + i}-01", "order_index": i}
+            for i in range(8)
+        ])
+        connection.execute(models.Education.__table__.insert(), [
+            {"institution": f"School {i}", "degree": "BSc", "order_index": i} for i in range(3)
+        ])
+        connection.execute(models.SocialLink.__table__.insert(), [
+            {"platform": name, "url": f"https://example.com/{name}", "order_index": i}
+            for i, name in enumerate(["github", "linkedin", "twitter"])
+        ])
+        connection.execute(models.Contact.__table__.insert(), [
+            {"name": f"Seed {i}", "email": f"seed{i}@example.com", "message": "Seeded contact message", "is_read": False}
+            for i in range(200)
+        ])
+        connection.execute(models.Blog.__table__.insert(), [
+            {"title": f"Post {i}", "slug": f"post-{i}", "excerpt": "lorem ipsum", "content": "lorem ipsum dolor " * 400,
+             "published": i % 10 != 0, "tags": ", ".join(rng.sample(TAGS, 3)), "views": 0}
+            for i in range(BLOGS)
+        ])
+
+    db = SessionLocal()
+    try:
+        for blog in db.query(models.Blog).all():
+            crud.set_blog_tags(db, blog.id, blog.tags)
+        db.commit()
+        crud.create_admin(db, ADMIN_USERNAME, get_password_hash(ADMIN_PASSWORD))
+    finally:
+        db.close()
+
+async def run_scenario(client, name, total, concurrency, headers):
+    method, build, needs_admin = SCENARIOS[name]
+    rng = random.Random(f"{SEED}-{name}")
+    requests = [build(rng, i) for i in range(total)]
+    timings = []
+    errors = 0
+    position = 0
+
+    async def worker():
+        nonlocal errors, position
+        while position < len(requests):
+            spec = requests[position]
+            position += 1
+            path, body = spec if isinstance(spec, tuple) else (spec, None)
+            started = time.perf_counter()
+            response = await client.request(method, path, json=body, headers=headers if needs_admin else None)
+            timings.append((time.perf_counter() - started) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "requests": total,
+        "concurrency": concurrency,
+        "errors": errors,
+        "throughput_rps": round(total / elapsed, 1),
+        "p50_ms": round(percentile(timings, 50), 2),
+        "p95_ms": round(percentile(timings, 95), 2),
+        "p99_ms": round(percentile(timings, 99), 2),
+        "mean_ms": round(statistics.mean(timings), 2),
+    }
+
+async def run_suite(total, concurrency):
+    import httpx
+    import main
+
+    main.limiter.enabled = False
+    results = {}
+    async with main.app.router.lifespan_context(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            login = await client.post("/api/admin/login", data={"username": ADMIN_USERNAME, "password": ADMIN_PASSWORD})
+            login.raise_for_status()
+            headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+            client.cookies.clear()
+
+            for name in SCENARIOS:
+                # Short warm-up so the first scenario does not pay for imports and connects
+                await run_scenario(client, name, min(total, concurrency * 2), concurrency, headers)
+                results[name] = await run_scenario(client, name, total, concurrency, headers)
+    return results
+
+def child(total, concurrency):
+    sys.path.insert(0, BACKEND)
+    os.chdir(BACKEND)
+    seed_database()
+    print(json.dumps(asyncio.run(run_suite(total, concurrency))))
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(total, concurrency, output, cache):
+    targets = {"sqlite": "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db")}
+    if os.environ.get("BENCH_DATABASE_URL"):
+        targets["postgresql"] = os.environ["BENCH_DATABASE_URL"]
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "requests_per_scenario": total,
+            "concurrency": concurrency,
+            "response_cache": cache,
+            "seed": SEED,
+        },
+        "results": {},
+    }
+    for name, url in targets.items():
+        env = dict(os.environ, DATABASE_URL=url, ADMIN_USERNAME=ADMIN_USERNAME, ADMIN_PASSWORD=ADMIN_PASSWORD,
+                   FAST_STARTUP="true", SQL_PROFILING="false", CONTACT_QUEUE_DIR=tempfile.mkdtemp())
+        if not cache:
+            env["RESPONSE_CACHE_TTL"] = "0"
+        print(f"Running {len(SCENARIOS)} scenarios against {name}...")
+        output_text = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", str(total), str(concurrency)],
+            env=env, check=True, stdout=subprocess.PIPE, text=True,
+        ).stdout
+        report["results"][name] = json.loads(output_text.strip().splitlines()[-1])
+        print_results(name, report["results"][name])
+
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"\n✓ Report written to {output}")
+
+def print_results(database, results):
+    print(f"\n{database}")
+    print("-" * 74)
+    print(f"{'scenario':<20} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for name, row in results.items():
+        print(f"{name:<20} {row['throughput_rps']:>9} {row['p50_ms']:>9} {row['p95_ms']:>9} {row['p99_ms']:>9} {row['errors']:>7}")
+
+def compare(before_path, after_path):
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+
+    print(f"{before['meta'].get('commit')} -> {after['meta'].get('commit')}")
+    for database, results in after["results"].items():
+        print(f"\n{database}")
+        print("-" * 62)
+        print(f"{'scenario':<20} {'rps':>13} {'p95 ms':>13} {'p99 ms':>13}")
+        for name, row in results.items():
+            old = before["results"].get(database, {}).get(name)
+            if not old:
+                print(f"{name:<20} {'(new)':>13}")
+                continue
+            cells = []
+            for key in ("throughput_rps", "p95_ms", "p99_ms"):
+                change = (row[key] - old[key]) / old[key] * 100 if old[key] else 0.0
+                cells.append(f"{change:+.1f}%")
+            print(f"{name:<20} {cells[0]:>13} {cells[1]:>13} {cells[2]:>13}")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(int(sys.argv[2]), int(sys.argv[3]))
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(description="Portfolio API load benchmark")
+    parser.add_argument("--requests", type=int, default=500, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--output", default="benchmark-report.json")
+    parser.add_argument("--no-cache", action="store_true", help="disable the response cache")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="compare two reports")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+    else:
+        run(args.requests, args.concurrency, args.output, cache=not args.no_cache)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Measure the cost of one rate limit check per storage backend
+
+Times `limiter.hit()` the way slowapi calls it for every rate-limited
+request, against slowapi's per-process `memory://` storage and the shared
+SQLite storage (rate_limit_storage.py), and reports p50/p99/mean in
+microseconds. A second pass runs several processes against one SQLite file,
+all hitting the same key, and checks that together they are allowed exactly
+`limit` hits, i.e. the limit is shared instead of multiplied.
+
+Usage (from the backend directory):
+  python benchmarks/rate_limit_storage.py [checks] [processes]
+"""
+
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND)
+
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import STRATEGIES
+
+import rate_limit_storage  # noqa: F401  registers sqlite://
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+def time_checks(uri, strategy, checks):
+    limiter = STRATEGIES[strategy](storage_from_string(uri))
+    item = parse("5/minute")
+    timings = []
+    for i in range(checks):
+        # A few hundred distinct clients, like requests from different IPs
+        key = f"10.0.{i % 256}.{i % 7}"
+        started = time.perf_counter()
+        limiter.hit(item, "/api/contact", key)
+        timings.append((time.perf_counter() - started) * 1_000_000)
+    return timings
+
+def hammer(uri, limit, attempts, start, results):
+    limiter = STRATEGIES["fixed-window"](storage_from_string(uri))
+    item = parse(f"{limit}/minute")
+    start.wait()
+    results.put(sum(limiter.hit(item, "/api/contact", "203.0.113.7") for _ in range(attempts)))
+
+def check_shared(uri, processes, limit=50):
+    context = multiprocessing.get_context("spawn")
+    start = context.Event()
+    results = context.Queue()
+    workers = [context.Process(target=hammer, args=(uri, limit, limit, start, results)) for _ in range(processes)]
+    for worker in workers:
+        worker.start()
+    start.set()
+    allowed = sum(results.get() for _ in workers)
+    for worker in workers:
+        worker.join()
+    return allowed
+
+def main(checks, processes):
+    directory = tempfile.mkdtemp()
+    backends = [
+        ("memory", "memory://", "fixed-window"),
+        ("sqlite", f"sqlite:///{directory}/fixed.db", "fixed-window"),
+        ("sqlite (sliding)", f"sqlite:///{directory}/sliding.db", "sliding-window-counter"),
+    ]
+
+    print(f"{'storage':<20} {'p50 µs':>9} {'p99 µs':>9} {'mean µs':>9}")
+    print("-" * 50)
+    for name, uri, strategy in backends:
+        timings = time_checks(uri, strategy, checks)
+        print(f"{name:<20} {percentile(timings, 50):>9.1f} {percentile(timings, 99):>9.1f} {statistics.mean(timings):>9.1f}")
+
+    limit = 50
+    allowed = check_shared(f"sqlite:///{directory}/shared.db", processes, limit)
+    print()
+    if allowed == limit:
+        print(f"✓ {processes} processes sharing one limit of {limit} were allowed {allowed} hits")
+        return True
+    print(f"✗ {processes} processes sharing one limit of {limit} were allowed {allowed} hits")
+    return False
+
+if __name__ == "__main__":
+    checks = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    print("Portfolio Website - Rate Limit Storage Benchmark")
+    print("=" * 50)
+    sys.exit(0 if main(checks, processes) else 1)
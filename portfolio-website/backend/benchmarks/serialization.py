@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of response serialization per public route
+
+For every cached public route, compares what a cache hit used to cost,
+FastAPI's response_model validation plus stdlib JSON encoding, with what it
+costs now: wrapping the bytes serialized once per content version. Also
+reports that one-off serialization (CachedPayload, orjson). Data comes from
+the same seeded database as load_suite.py; no HTTP or database time is
+included.
+
+Usage (from the backend directory):
+  python benchmarks/serialization.py [iterations]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND)
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "serialization.db")
+os.environ.setdefault("FAST_STARTUP", "true")
+os.environ.setdefault("SQL_PROFILING", "false")
+os.environ.setdefault("RATE_LIMIT_STORAGE_URI", "memory://")
+
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import serialize_response
+
+import crud
+import main
+import schemas
+from cache import CachedPayload
+from database import SessionLocal
+from load_suite import seed_database
+
+def _list(schema, rows):
+    return [schema.model_validate(row) for row in rows]
+
+# route path -> loader producing what the route caches
+ROUTES = {
+    "/api/portfolio": lambda db: schemas.Portfolio.model_validate(crud.get_portfolio(db), from_attributes=True),
+    "/api/about": lambda db: schemas.About.model_validate(crud.get_about(db)),
+    "/api/stack": lambda db: _list(schemas.Stack, crud.get_stacks(db)),
+    "/api/projects": lambda db: _list(schemas.Project, crud.get_projects(db)),
+    "/api/experience": lambda db: _list(schemas.Experience, crud.get_experiences(db)),
+    "/api/education": lambda db: _list(schemas.Education, crud.get_educations(db)),
+    "/api/social-links": lambda db: _list(schemas.SocialLink, crud.get_social_links(db)),
+    "/api/blogs": lambda db: _list(schemas.BlogSummary, crud.get_blogs(db, limit=20)),
+    "/api/tags": lambda db: _list(schemas.TagCount, crud.get_tag_counts(db)),
+    "/api/blogs/{slug}": lambda db: schemas.Blog.model_validate(crud.get_blog_by_slug(db, "post-1")),
+}
+
+def response_fields():
+    return {route.path: route.response_field for route in main.app.routes if getattr(route, "path", None) in ROUTES}
+
+def time_us(fn, iterations):
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return statistics.median(samples)
+
+async def time_us_async(fn, iterations):
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return statistics.median(samples)
+
+async def benchmark(iterations):
+    seed_database()
+    fields = response_fields()
+    db = SessionLocal()
+    try:
+        data = {path: loader(db) for path, loader in ROUTES.items()}
+    finally:
+        db.close()
+
+    print(f"{'route':<20} {'bytes':>7} {'before µs':>10} {'after µs':>9} {'build once µs':>14}")
+    print("-" * 64)
+    for path, content in data.items():
+        field = fields[path]
+
+        async def before():
+            # The old per-hit path: response_model validation, jsonable_encoder
+            # and json.dumps inside JSONResponse
+            value = await serialize_response(field=field, response_content=content, is_coroutine=True)
+            return JSONResponse(content=value)
+
+        payload = CachedPayload(content)
+        if path == "/api/blogs/{slug}":
+            # Detail pages splice the live view count into the cached bytes
+            prefix = payload.body[:-1]
+            after = lambda: Response(content=prefix + b"%d}" % 1234, media_type="application/json")
+        else:
+            after = lambda: Response(content=payload.body, media_type="application/json")
+
+        before_us = await time_us_async(before, iterations)
+        after_us = time_us(after, iterations)
+        build_us = time_us(lambda: CachedPayload(content), max(1, iterations // 10))
+        print(f"{path:<20} {len(payload.body):>7} {before_us:>10.1f} {after_us:>9.1f} {build_us:>14.1f}")
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print("Portfolio Website - Response Serialization Benchmark")
+    print("=" * 64)
+    asyncio.run(benchmark(iterations))
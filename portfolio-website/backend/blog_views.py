@@ -0,0 +1,86 @@
+import asyncio
+import os
+import threading
+from typing import Dict
+from dotenv import load_dotenv
+
+import crud
+from database import SessionLocal
+
+load_dotenv()
+
+BLOG_VIEWS_FLUSH_INTERVAL = float(os.getenv("BLOG_VIEWS_FLUSH_INTERVAL", "10"))
+
+
+class BlogViewCounter:
+    """
+    Buffers blog page views in memory and writes them in batches.
+
+    `record()` only bumps an in-process counter, so reading a post never
+    takes a row lock. `flush()` swaps the buffer out and applies every
+    pending count in one transaction; if the write fails the counts are
+    put back and retried on the next flush.
+    """
+
+    def __init__(self, flush_interval: float = BLOG_VIEWS_FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self._pending: Dict[int, int] = {}
+        self._totals: Dict[int, int] = {}  # views recorded by this process
+        self._lock = threading.Lock()
+        self._task = None
+
+    def record(self, blog_id: int):
+        with self._lock:
+            self._pending[blog_id] = self._pending.get(blog_id, 0) + 1
+            self._totals[blog_id] = self._totals.get(blog_id, 0) + 1
+
+    def pending(self, blog_id: int) -> int:
+        with self._lock:
+            return self._pending.get(blog_id, 0)
+
+    def total(self, blog_id: int) -> int:
+        with self._lock:
+            return self._totals.get(blog_id, 0)
+
+    def flush(self):
+        with self._lock:
+            counts, self._pending = self._pending, {}
+        if not counts:
+            return 0
+
+        db = SessionLocal()
+        try:
+            crud.add_blog_views(db, counts)
+        except Exception as e:
+            db.rollback()
+            with self._lock:
+                for blog_id, n in counts.items():
+                    self._pending[blog_id] = self._pending.get(blog_id, 0) + n
+            print(f"⚠️  WARNING: Failed to flush blog views, will retry: {e}")
+            return 0
+        finally:
+            db.close()
+        return sum(counts.values())
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await loop.run_in_executor(None, self.flush)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.get_running_loop().run_in_executor(None, self.flush)
+
+
+blog_view_counter = BlogViewCounter()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Create the admin user from .env if it does not exist yet
+The API does this on startup unless FAST_STARTUP=true; in that mode run
+this once per deployment, after migrating:
+  alembic upgrade head
+  python bootstrap_admin.py
+"""
+
+import os
+import sys
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+
+import crud
+from auth import get_password_hash
+from database import SessionLocal
+
+load_dotenv()
+
+WEAK_PASSWORDS = ["changeme123", "admin", "password", "123456"]
+
+def bootstrap_admin(db: Session) -> bool:
+    """Create the admin from ADMIN_USERNAME / ADMIN_PASSWORD; False if they are not set"""
+    # Security: Force users to set credentials in .env
+    admin_username = os.getenv("ADMIN_USERNAME")
+    admin_password = os.getenv("ADMIN_PASSWORD")
+
+    if not admin_username or not admin_password:
+        print("⚠️  WARNING: ADMIN_USERNAME and ADMIN_PASSWORD must be set in .env file!")
+        print("⚠️  Admin panel will not be accessible until credentials are configured.")
+        return False
+
+    if admin_password in WEAK_PASSWORDS:
+        raise ValueError(
+            "🚨 SECURITY ERROR: Weak password detected! "
+            "Set a strong ADMIN_PASSWORD in .env (min 12 chars, mix of upper, lower, numbers, symbols)"
+        )
+
+    admin = crud.get_admin_by_username(db, admin_username)
+    if not admin:
+        hashed_password = get_password_hash(admin_password)
+        crud.create_admin(db, admin_username, hashed_password)
+        print(f"✅ Admin created: {admin_username}")
+        print("🔒 Password is securely hashed in database")
+    else:
+        print(f"✓ Admin already exists: {admin_username}")
+    return True
+
+if __name__ == "__main__":
+    print("Portfolio Website - Admin Bootstrap")
+    print("=" * 50)
+
+    db = SessionLocal()
+    try:
+        ok = bootstrap_admin(db)
+    except ValueError as e:
+        print(f"✗ {e}")
+        ok = False
+    finally:
+        db.close()
+    sys.exit(0 if ok else 1)
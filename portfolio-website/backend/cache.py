@@ -0,0 +1,169 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+import orjson
+from dotenv import load_dotenv
+from pydantic import BaseModel
+from typing import Optional
+
+from compression import compress
+
+load_dotenv()
+
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "300"))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "256"))
+
+
+class ResponseCache:
+    """
+    Bounded in-process cache for public GET responses.
+
+    Entries expire after `ttl` seconds and the least recently used entry is
+    evicted once `max_entries` is reached. Every entry is tagged with the
+    tables it was built from, and `invalidate(table)` drops exactly those
+    entries; it also bumps the table's generation, so a response loaded
+    while the write happened is not stored. The cache is per process: with
+    several workers, a write only clears the worker that served it and the
+    others catch up within `ttl`.
+    """
+
+    def __init__(self, ttl: float = RESPONSE_CACHE_TTL, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, tables, value)
+        self._generations = {}  # table -> version, bumped on every write
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get_or_set(self, key, tables, loader):
+        hit, value, generations = self._lookup(key, tables)
+        if hit:
+            return value
+        value = loader()
+        self._store(key, tables, generations, value)
+        return value
+
+    async def aget_or_set(self, key, tables, loader):
+        # Same as get_or_set for async handlers; `loader` returns an awaitable
+        hit, value, generations = self._lookup(key, tables)
+        if hit:
+            return value
+        value = await loader()
+        self._store(key, tables, generations, value)
+        return value
+
+    def _lookup(self, key, tables):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[2], None
+            self.misses += 1
+            return False, None, [self._generations.get(table, 0) for table in tables]
+
+    def _store(self, key, tables, generations, value):
+        with self._lock:
+            # Skip storing if a write invalidated one of our tables while loading
+            if generations != [self._generations.get(table, 0) for table in tables]:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, tuple(tables), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, table: str):
+        with self._lock:
+            self._generations[table] = self._generations.get(table, 0) + 1
+            self.invalidations += 1
+            stale = [key for key, entry in self._entries.items() if table in entry[1]]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "generations": dict(self._generations),
+            }
+
+
+def to_json_bytes(data) -> bytes:
+    """
+    Encode validated schemas (or lists of them) to the JSON that FastAPI's
+    response_model path would send. Pydantic's JSON mode keeps datetimes and
+    URLs formatted as before; orjson then does the encoding itself.
+    """
+    if isinstance(data, BaseModel):
+        data = data.model_dump(mode="json")
+    elif isinstance(data, list):
+        data = [item.model_dump(mode="json") if isinstance(item, BaseModel) else item for item in data]
+    return orjson.dumps(data)
+
+
+class CachedPayload:
+    """
+    A response body, serialized once per content version, with its ETag.
+
+    `data` keeps the validated schemas for callers that need to look at
+    them (cursors, 404 checks); `body` is the encoded JSON sent as-is on
+    every hit, and `encoded()` keeps its gzip / Brotli variants. The ETag
+    is a digest of the body, identical on every worker and never a false
+    304. A conditional request that misses the cache (after the TTL, a
+    write, or on another worker) still loads and serializes the body
+    before it can answer 304.
+    """
+
+    __slots__ = ("data", "body", "etag", "_variants")
+
+    def __init__(self, data):
+        self.data = data
+        self.body = to_json_bytes(data)
+        self.etag = 'W/"%s"' % hashlib.sha1(self.body).hexdigest()
+        self._variants = {}
+
+    def encoded(self, encoding: str) -> bytes:
+        # Compressed on the first request that asks for this encoding, then
+        # reused until the entry is invalidated with the rest of the payload
+        body = self._variants.get(encoding)
+        if body is None:
+            body = self._variants[encoding] = compress(self.body, encoding, cached=True)
+        return body
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison (RFC 9110): ignore the W/ prefix on both sides
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+response_cache = ResponseCache()
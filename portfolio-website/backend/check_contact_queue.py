@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Check crash recovery of the contact write-behind queue
+Leaves an orphaned log behind, as a crashed worker would, and starts
+queues against it: one after the other with a stale directory listing,
+and several processes at once. Recovery must not fail, must replay every
+orphaned submission exactly once and must not leave the orphan's files
+behind.
+
+Usage:
+  python check_contact_queue.py [rounds]
+"""
+
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "check.db")
+
+from contact_queue import ContactQueue
+
+ORPHAN_RECORDS = 5
+
+def write_orphan(directory, name="99999"):
+    path = os.path.join(directory, name + ".log")
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(ORPHAN_RECORDS):
+            f.write(json.dumps({
+                "submission_id": f"{name}-{i}", "name": "n", "email": "a@b.com", "subject": None,
+                "message": "hello there, world", "created_at": "2026-01-01T00:00:00+00:00",
+            }) + "\n")
+    return path
+
+def orphan_files(directory, name="99999"):
+    return sorted(glob.glob(os.path.join(directory, name + ".*")))
+
+def check_stale_listing():
+    """A worker whose glob still lists an orphan another worker already recovered"""
+    directory = tempfile.mkdtemp()
+    path = write_orphan(directory)
+    first = ContactQueue(directory)
+    first.open()
+    claim = ContactQueue(directory)._claim_orphan(path)
+    leftovers = orphan_files(directory)
+    if first.recovered != ORPHAN_RECORDS or claim is not None or leftovers:
+        print(f"✗ stale listing: recovered {first.recovered}, claim {claim}, leftovers {leftovers}")
+        return False
+    print("✓ stale listing: orphan skipped, no lock file recreated")
+    return True
+
+def start_queue(directory, barrier, results):
+    queue = ContactQueue(directory)
+    barrier.wait()
+    try:
+        queue.open()
+        results.put(queue.recovered)
+    except Exception as e:
+        results.put(repr(e))
+
+def check_overlapping_open(rounds, workers=2):
+    """Several workers starting at once against the same orphan"""
+    context = multiprocessing.get_context("spawn")
+    for round_number in range(rounds):
+        directory = tempfile.mkdtemp()
+        write_orphan(directory)
+        barrier = context.Barrier(workers)
+        results = context.Queue()
+        processes = [context.Process(target=start_queue, args=(directory, barrier, results)) for _ in range(workers)]
+        for process in processes:
+            process.start()
+        outcomes = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+
+        errors = [outcome for outcome in outcomes if not isinstance(outcome, int)]
+        leftovers = orphan_files(directory)
+        if errors or sum(outcome for outcome in outcomes if isinstance(outcome, int)) != ORPHAN_RECORDS or leftovers:
+            print(f"✗ overlapping open, round {round_number + 1}: {outcomes}, leftovers {leftovers}")
+            return False
+    print(f"✓ overlapping open: {rounds} rounds of {workers} workers, every orphan recovered once")
+    return True
+
+if __name__ == "__main__":
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print("Portfolio Website - Contact Queue Recovery Check")
+    print("=" * 50)
+    ok = check_stale_listing()
+    ok = check_overlapping_open(rounds) and ok
+    print()
+    print("✓ Contact queue recovery is safe" if ok else "✗ Contact queue recovery failed")
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Check that every read query in crud.py is served by an index
+Runs each crud.get_* helper against DATABASE_URL, captures the SQL it sends
+and prints the EXPLAIN plan. Fails on full table scans and on sorts that
+an index should have covered.
+
+Run after migrating:
+  alembic upgrade head
+  python check_indexes.py
+"""
+
+import re
+import sys
+from datetime import datetime
+from sqlalchemy import event, text
+
+import crud
+from database import engine, SessionLocal
+from pagination import encode_cursor
+
+# about holds a single row and is read with LIMIT 1, and get_tag_counts
+# aggregates every tag, so both are expected to scan and are not listed
+CHECKS = [
+    ("get_stacks", lambda db: crud.get_stacks(db)),
+    ("get_stack", lambda db: crud.get_stack(db, 1)),
+    ("get_projects", lambda db: crud.get_projects(db)),
+    ("get_projects(featured_only)", lambda db: crud.get_projects(db, featured_only=True)),
+    ("get_project", lambda db: crud.get_project(db, 1)),
+    ("get_experiences", lambda db: crud.get_experiences(db)),
+    ("get_experience", lambda db: crud.get_experience(db, 1)),
+    ("get_educations", lambda db: crud.get_educations(db)),
+    ("get_education", lambda db: crud.get_education(db, 1)),
+    ("get_social_links", lambda db: crud.get_social_links(db)),
+    ("get_social_link", lambda db: crud.get_social_link(db, 1)),
+    ("get_contacts", lambda db: crud.get_contacts(db)),
+    ("get_contacts(after)", lambda db: crud.get_contacts(db, after=encode_cursor(datetime.now(), 1))),
+    ("get_contact", lambda db: crud.get_contact(db, 1)),
+    ("get_admin_by_username", lambda db: crud.get_admin_by_username(db, "admin")),
+    ("get_blogs", lambda db: crud.get_blogs(db)),
+    ("get_blogs(published_only)", lambda db: crud.get_blogs(db, published_only=True)),
+    ("get_blogs(published_only, after)", lambda db: crud.get_blogs(db, published_only=True, after=encode_cursor(datetime.now(), 1))),
+    ("get_blogs(published_only, tag)", lambda db: crud.get_blogs(db, published_only=True, tag="python")),
+    ("get_blog_by_id", lambda db: crud.get_blog_by_id(db, 1)),
+    ("get_blog_by_slug", lambda db: crud.get_blog_by_slug(db, "hello-world")),
+]
+
+def capture_statements(db, call):
+    """Run a crud helper and return the (statement, parameters) it executed"""
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        call(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return captured
+
+def explain(db, statement, parameters):
+    """Return (plan lines, problems) for one statement"""
+    connection = db.connection()
+    dialect = connection.dialect.name
+
+    if dialect == "sqlite":
+        rows = connection.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).fetchall()
+        plan = [row[-1] for row in rows]
+        problems = [line for line in plan if (line.startswith("SCAN") and "USING" not in line) or "TEMP B-TREE" in line]
+    elif dialect == "postgresql":
+        # Tiny tables make a sequential scan the cheapest plan; disable it to
+        # see whether an index could serve the query at all
+        connection.execute(text("SET LOCAL enable_seqscan = off"))
+        rows = connection.exec_driver_sql("EXPLAIN " + statement, parameters).fetchall()
+        plan = [row[0] for row in rows]
+        problems = [line for line in plan if re.search(r"Seq Scan|(^|->\s+)Sort\b", line.strip())]
+    else:
+        raise SystemExit(f"✗ Unsupported database dialect: {dialect}")
+    return plan, problems
+
+def check_indexes():
+    db = SessionLocal()
+    failures = 0
+
+    try:
+        for name, call in CHECKS:
+            for statement, parameters in capture_statements(db, call):
+                plan, problems = explain(db, statement, parameters)
+                if problems:
+                    failures += 1
+                    print(f"✗ {name}")
+                else:
+                    print(f"✓ {name}")
+                for line in plan:
+                    print(f"    {line}")
+    finally:
+        db.rollback()
+        db.close()
+
+    print()
+    if failures:
+        print(f"✗ {failures} queries are not served by an index")
+        return False
+    print("✓ All queries use an index")
+    return True
+
+if __name__ == "__main__":
+    print("Portfolio Website - Index Check")
+    print("=" * 50)
+    sys.exit(0 if check_indexes() else 1)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Check how many SQL statements each crud.py write sends
+Runs every create/update/delete helper against a throwaway SQLite database,
+counts the statements it executes and fails if one sends more than its
+budget, e.g. if an update goes back to SELECT + UPDATE + refresh.
+
+Usage:
+  python check_query_counts.py
+
+Set CHECK_DATABASE_URL to an empty PostgreSQL database to check there.
+"""
+
+import os
+import sys
+import tempfile
+
+os.environ["DATABASE_URL"] = os.environ.get(
+    "CHECK_DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "check.db"))
+
+from sqlalchemy import event
+
+import crud
+import models
+import schemas
+from database import SessionLocal, engine
+
+# Tag sync is delete + select + insert new tags + insert links
+TAG_SYNC = 4
+
+# (name, call, statement budget)
+CHECKS = [
+    ("create_about", lambda db: crud.create_about(db, schemas.AboutCreate(title="t", description="d")), 1),
+    ("update_about", lambda db: crud.update_about(db, 1, schemas.AboutUpdate(title="t2", description="d")), 1),
+    ("create_stack", lambda db: crud.create_stack(db, schemas.StackCreate(name="s")), 1),
+    ("update_stack", lambda db: crud.update_stack(db, 1, schemas.StackUpdate(name="s2")), 1),
+    ("update_stack(missing)", lambda db: crud.update_stack(db, 999, schemas.StackUpdate(name="s2")), 1),
+    ("delete_stack", lambda db: crud.delete_stack(db, 1), 1),
+    ("delete_stack(missing)", lambda db: crud.delete_stack(db, 999), 1),
+    ("create_project", lambda db: crud.create_project(db, schemas.ProjectCreate(title="p", description="d")), 1),
+    ("update_project", lambda db: crud.update_project(db, 1, schemas.ProjectUpdate(featured=True)), 1),
+    ("delete_project", lambda db: crud.delete_project(db, 1), 1),
+    ("create_experience", lambda db: crud.create_experience(db, schemas.ExperienceCreate(company="c", position="p")), 1),
+    ("update_experience", lambda db: crud.update_experience(db, 1, schemas.ExperienceUpdate(position="p2")), 1),
+    ("delete_experience", lambda db: crud.delete_experience(db, 1), 1),
+    ("create_education", lambda db: crud.create_education(db, schemas.EducationCreate(institution="i", degree="d")), 1),
+    ("update_education", lambda db: crud.update_education(db, 1, schemas.EducationUpdate(degree="d2")), 1),
+    ("delete_education", lambda db: crud.delete_education(db, 1), 1),
+    ("create_social_link", lambda db: crud.create_social_link(db, schemas.SocialLinkCreate(platform="gh", url="https://github.com")), 1),
+    ("update_social_link", lambda db: crud.update_social_link(db, 1, schemas.SocialLinkUpdate(order_index=2)), 1),
+    ("delete_social_link", lambda db: crud.delete_social_link(db, 1), 1),
+    ("create_contact", lambda db: crud.create_contact(db, schemas.ContactCreate(name="n", email="a@b.com", message="hello there, world")), 1),
+    ("insert_contacts", lambda db: crud.insert_contacts(db, [
+        {"submission_id": f"s{i}", "name": "n", "email": "a@b.com", "message": "hello there, world",
+         "created_at": "2026-01-01T00:00:00+00:00"} for i in range(50)
+    ]), 2),
+    ("mark_contact_read", lambda db: crud.mark_contact_read(db, 1), 1),
+    ("delete_contact", lambda db: crud.delete_contact(db, 1), 1),
+    ("create_blog", lambda db: crud.create_blog(db, schemas.BlogCreate(title="b", slug="b", content="c", published=True, tags="a, b")), 1 + TAG_SYNC),
+    ("update_blog", lambda db: crud.update_blog(db, 1, schemas.BlogUpdate(title="b2")), 1),
+    ("update_blog(tags)", lambda db: crud.update_blog(db, 1, schemas.BlogUpdate(tags="c")), 1 + TAG_SYNC),
+    ("delete_blog", lambda db: crud.delete_blog(db, 1), 2),
+    ("reorder", lambda db: crud.reorder(db, "stack", [2, 3]), 1),
+]
+
+def count_statements(db, call):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        call(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+def check_query_counts():
+    models.Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    failures = 0
+
+    try:
+        # Two stack rows for the reorder check
+        crud.create_stack(db, schemas.StackCreate(name="a"))
+        crud.create_stack(db, schemas.StackCreate(name="b"))
+        for name, call, budget in CHECKS:
+            statements = count_statements(db, call)
+            if len(statements) > budget:
+                failures += 1
+                print(f"✗ {name}: {len(statements)} statements (budget {budget})")
+                for statement in statements:
+                    print(f"    {' '.join(statement.split())[:120]}")
+            else:
+                print(f"✓ {name}: {len(statements)}")
+    finally:
+        db.close()
+
+    print()
+    if failures:
+        print(f"✗ {failures} operations exceed their statement budget")
+        return False
+    print("✓ All writes within their statement budget")
+    return True
+
+if __name__ == "__main__":
+    print("Portfolio Website - Query Count Check")
+    print("=" * 50)
+    sys.exit(0 if check_query_counts() else 1)
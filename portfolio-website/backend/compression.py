@@ -0,0 +1,161 @@
+import os
+import zlib
+from typing import Optional
+from dotenv import load_dotenv
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # optional: without it only gzip is offered
+    brotli = None
+
+load_dotenv()
+
+COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+
+# Per-request compression trades ratio for speed. Cached bodies are
+# compressed once per content version and get higher settings; Brotli stops
+# at 9 because 10-11 cost 10-50x more time (on the event loop) for a few
+# percent on API-sized JSON.
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+CACHED_GZIP_LEVEL = 9
+CACHED_BROTLI_QUALITY = 9
+
+# In order of preference when the client accepts several equally
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "application/xml", "image/svg+xml")
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick an encoding from an Accept-Encoding header; None means identity"""
+    if not COMPRESSION_ENABLED or not accept_encoding:
+        return None
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in ENCODINGS:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+class _Compressor:
+    """Streaming gzip or Brotli compressor with one interface"""
+
+    def __init__(self, encoding: str, cached: bool = False):
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=CACHED_BROTLI_QUALITY if cached else BROTLI_QUALITY)
+            self._zlib = None
+        else:
+            # wbits=31: gzip container rather than raw zlib
+            self._zlib = zlib.compressobj(CACHED_GZIP_LEVEL if cached else GZIP_LEVEL, zlib.DEFLATED, 31)
+            self._brotli = None
+
+    def compress(self, data: bytes) -> bytes:
+        return self._zlib.compress(data) if self._zlib else self._brotli.process(data)
+
+    def finish(self) -> bytes:
+        return self._zlib.flush() if self._zlib else self._brotli.finish()
+
+
+def compress(body: bytes, encoding: str, cached: bool = False) -> bytes:
+    compressor = _Compressor(encoding, cached)
+    return compressor.compress(body) + compressor.finish()
+
+
+class CompressionMiddleware:
+    """
+    Pure ASGI middleware for negotiated gzip / Brotli response compression.
+
+    Compresses text and JSON bodies of at least `minimum_size` bytes, and
+    streamed bodies as they are sent. Responses that already carry a
+    Content-Encoding pass through untouched; that is how the public routes
+    send the variants they keep in the response cache (see
+    CachedPayload.encoded).
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+        compressor = None
+        passthrough = False
+        buffered = []  # chunks held until there is enough to decide
+        buffered_size = 0
+
+        async def send_wrapper(message):
+            nonlocal start, compressor, passthrough, buffered_size
+            if message["type"] == "http.response.start":
+                # Held back until the body shows whether to compress
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is not None:
+                data = compressor.compress(body)
+                if not more_body:
+                    data += compressor.finish()
+                await send({"type": "http.response.body", "body": data, "more_body": more_body})
+                return
+
+            # Bodies may arrive in chunks (e.g. through BaseHTTPMiddleware),
+            # so collect them until the size threshold or the end is reached
+            buffered.append(body)
+            buffered_size += len(body)
+            if more_body and buffered_size < self.minimum_size:
+                return
+            body = b"".join(buffered)
+            buffered.clear()
+
+            headers = MutableHeaders(scope=start)
+            content_type = headers.get("content-type", "")
+            if (
+                "content-encoding" in headers
+                or not content_type.startswith(COMPRESSIBLE_TYPES)
+                or len(body) < self.minimum_size
+            ):
+                passthrough = True
+                await send(start)
+                await send({"type": "http.response.body", "body": body, "more_body": more_body})
+                return
+
+            compressor = _Compressor(encoding)
+            data = compressor.compress(body)
+            if more_body:
+                del headers["content-length"]
+            else:
+                data += compressor.finish()
+                headers["content-length"] = str(len(data))
+            headers["content-encoding"] = encoding
+            headers.add_vary_header("Accept-Encoding")
+            await send(start)
+            await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
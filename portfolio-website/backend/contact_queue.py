@@ -0,0 +1,315 @@
+import asyncio
+import bisect
+import contextlib
+import glob
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List
+from dotenv import load_dotenv
+
+import crud
+import schemas
+from database import SessionLocal
+from metrics import LATENCY_BUCKETS
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, run a single worker there
+    fcntl = None
+
+load_dotenv()
+
+CONTACT_QUEUE_DIR = os.getenv("CONTACT_QUEUE_DIR", "contact-queue")
+CONTACT_QUEUE_FLUSH_INTERVAL = float(os.getenv("CONTACT_QUEUE_FLUSH_INTERVAL", "1"))
+CONTACT_QUEUE_BATCH_SIZE = int(os.getenv("CONTACT_QUEUE_BATCH_SIZE", "200"))
+CONTACT_QUEUE_MAX_PENDING = int(os.getenv("CONTACT_QUEUE_MAX_PENDING", "10000"))
+
+
+class ContactQueueFull(Exception):
+    pass
+
+
+class ContactQueue:
+    """
+    Write-behind queue for contact form submissions.
+
+    `submit()` appends the validated submission to an append-only log file
+    and fsyncs it before returning, so the request is acknowledged without
+    touching the database. `flush()` inserts pending submissions in batches
+    of `batch_size`; a failed batch stays queued for the next flush.
+
+    Every worker process writes its own `<pid>.log` under `directory` and
+    holds a lock on `<pid>.lock` while running. On start, logs whose lock is
+    free belong to a process that died (or to this pid in a previous run)
+    and are replayed. Each submission carries a `submission_id` that the
+    contact table keeps unique, so replaying rows that were inserted just
+    before a crash does not duplicate them.
+    """
+
+    def __init__(
+        self,
+        directory: str = CONTACT_QUEUE_DIR,
+        flush_interval: float = CONTACT_QUEUE_FLUSH_INTERVAL,
+        batch_size: int = CONTACT_QUEUE_BATCH_SIZE,
+        max_pending: int = CONTACT_QUEUE_MAX_PENDING,
+    ):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self._pending: List[Dict] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # one flush at a time
+        self._log = None
+        self._lock_file = None
+        self._path = None
+        self._task = None
+        self.submitted = 0
+        self.written = 0
+        self.recovered = 0
+        self.rejected = 0
+        self.failed_flushes = 0
+        self._flush_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self._flush_seconds = 0.0
+
+    # --- log file ---
+
+    def open(self):
+        with self._lock:
+            if self._log is not None:
+                return
+            os.makedirs(self.directory, exist_ok=True)
+            name = str(os.getpid())
+            self._lock_file = open(os.path.join(self.directory, name + ".lock"), "w")
+            if fcntl is not None:
+                fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            self._path = os.path.join(self.directory, name + ".log")
+
+            # One worker recovers at a time: otherwise two workers starting
+            # together could both glob an orphan that the first then removes
+            recovery_lock = open(os.path.join(self.directory, "recovery.lock"), "w")
+            try:
+                if fcntl is not None:
+                    fcntl.flock(recovery_lock, fcntl.LOCK_EX)
+                recovered = self._recover()
+            finally:
+                recovery_lock.close()
+            self._pending.extend(recovered)
+            self.recovered += len(recovered)
+        if recovered:
+            print(f"✓ Recovered {len(recovered)} queued contact submissions")
+
+    def _recover(self):
+        # This pid's log from a previous run comes first, then orphans
+        recovered = self._read_log(self._path)
+        orphans = []
+        for path in sorted(glob.glob(os.path.join(self.directory, "*.log"))):
+            if path != self._path:
+                orphan = self._claim_orphan(path)
+                if orphan is not None:
+                    orphans.append(orphan)
+                    recovered += self._read_log(path)
+
+        # Persist everything in our own log before the orphans go away
+        self._rewrite(recovered)
+        for path, lock_file in orphans:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path)
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(lock_file.name)
+            lock_file.close()
+        return recovered
+
+    def _claim_orphan(self, path):
+        """Lock the log of a worker that is gone; None if it is still running"""
+        try:
+            lock_file = open(path[:-len(".log")] + ".lock", "a")
+        except OSError:
+            return None
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                lock_file.close()
+                return None
+        if not os.path.exists(path):
+            # Claimed and removed by another worker after our glob; opening
+            # its lock file above created it again
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(lock_file.name)
+            lock_file.close()
+            return None
+        return path, lock_file
+
+    @staticmethod
+    def _read_log(path):
+        records = []
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # Only the last line can be torn, by a crash mid-write;
+                        # it was never acknowledged
+                        print(f"⚠️  WARNING: Skipping unreadable line in {path}")
+        except FileNotFoundError:
+            pass
+        return records
+
+    def _append(self, records):
+        if not records:
+            return
+        self._log.write("".join(json.dumps(record) + "\n" for record in records))
+        self._log.flush()
+        os.fsync(self._log.fileno())
+
+    def _rewrite(self, records):
+        # Write the new contents next to the log and swap them in, so a crash
+        # leaves either the old or the new file, never half of one
+        tmp_path = self._path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as tmp:
+            tmp.write("".join(json.dumps(record) + "\n" for record in records))
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_path, self._path)
+        if self._log is not None:
+            self._log.close()
+        self._log = open(self._path, "a", encoding="utf-8")
+
+    def _compact(self):
+        # Called with self._lock held, after a batch was inserted
+        if self._pending:
+            self._rewrite(self._pending)
+        else:
+            self._log.truncate(0)
+            os.fsync(self._log.fileno())
+
+    # --- queue ---
+
+    def submit(self, contact: schemas.ContactCreate) -> Dict:
+        record = contact.dict()
+        record["submission_id"] = uuid.uuid4().hex
+        record["created_at"] = datetime.now(timezone.utc).isoformat()
+        self.open()
+        with self._lock:
+            if len(self._pending) >= self.max_pending:
+                self.rejected += 1
+                raise ContactQueueFull()
+            self._append([record])
+            self._pending.append(record)
+            self.submitted += 1
+        return record
+
+    def flush(self):
+        """Insert everything pending, one batch at a time; returns the rows written"""
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    batch = self._pending[:self.batch_size]
+                if not batch:
+                    return written
+
+                started = time.perf_counter()
+                db = SessionLocal()
+                try:
+                    inserted = crud.insert_contacts(db, batch)
+                except Exception as e:
+                    db.rollback()
+                    with self._lock:
+                        self.failed_flushes += 1
+                    print(f"⚠️  WARNING: Failed to write contact submissions, will retry: {e}")
+                    return written
+                finally:
+                    db.close()
+                elapsed = time.perf_counter() - started
+
+                with self._lock:
+                    # Only flush() removes entries, so the batch is still at the front
+                    del self._pending[:len(batch)]
+                    self._compact()
+                    self.written += inserted
+                    self._flush_buckets[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+                    self._flush_seconds += elapsed
+                written += inserted
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await loop.run_in_executor(None, self.flush)
+
+    def start(self):
+        self.open()
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.get_running_loop().run_in_executor(None, self.flush)
+
+    # --- reporting ---
+
+    def stats(self):
+        with self._lock:
+            flushes = sum(self._flush_buckets)
+            return {
+                "depth": len(self._pending),
+                "max_pending": self.max_pending,
+                "submitted": self.submitted,
+                "written": self.written,
+                "recovered": self.recovered,
+                "rejected": self.rejected,
+                "flushes": flushes,
+                "failed_flushes": self.failed_flushes,
+                "avg_flush_ms": round(self._flush_seconds / flushes * 1000, 2) if flushes else None,
+            }
+
+    def render_metrics(self) -> str:
+        """Prometheus text lines, appended to the output of /metrics"""
+        with self._lock:
+            depth = len(self._pending)
+            buckets = list(self._flush_buckets)
+            flush_seconds = self._flush_seconds
+            counters = [
+                ("contact_queue_submitted_total", "Contact submissions acknowledged.", self.submitted),
+                ("contact_queue_written_total", "Contact submissions inserted into the database.", self.written),
+                ("contact_queue_rejected_total", "Contact submissions refused because the queue was full.", self.rejected),
+                ("contact_queue_failed_flushes_total", "Batch inserts that failed and were retried.", self.failed_flushes),
+            ]
+
+        lines = [
+            "# HELP contact_queue_depth Contact submissions waiting to be inserted.",
+            "# TYPE contact_queue_depth gauge",
+            f"contact_queue_depth {depth}",
+        ]
+        for name, help_text, value in counters:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter", f"{name} {value}"]
+
+        lines += [
+            "# HELP contact_queue_flush_duration_seconds Time to insert one batch of contact submissions.",
+            "# TYPE contact_queue_flush_duration_seconds histogram",
+        ]
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS, buckets):
+            cumulative += count
+            lines.append(f'contact_queue_flush_duration_seconds_bucket{{le="{bound}"}} {cumulative}')
+        total = cumulative + buckets[-1]
+        lines.append(f'contact_queue_flush_duration_seconds_bucket{{le="+Inf"}} {total}')
+        lines.append(f"contact_queue_flush_duration_seconds_sum {flush_seconds:.6f}")
+        lines.append(f"contact_queue_flush_duration_seconds_count {total}")
+        return "\n".join(lines) + "\n"
+
+
+contact_queue = ContactQueue()
@@ -1,27 +1,36 @@
-from sqlalchemy.orm import Session
-from typing import List, Optional
+import re
+from datetime import datetime
+from pydantic import ValidationError
+from sqlalchemy import bindparam, case, column, delete, func, insert, literal_column, or_, select, table, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, defer
+from typing import Dict, List, Optional
 import models
 import schemas
+from cache import response_cache
+from pagination import newest_first
+from repository import Repository
+
+# Writes go through one Repository per model: a single INSERT / UPDATE /
+# DELETE ... RETURNING per call (see repository.py)
+abouts = Repository(models.About, "about")
+stacks = Repository(models.Stack, "stack")
+projects = Repository(models.Project, "projects")
+experiences = Repository(models.Experience, "experience")
+educations = Repository(models.Education, "education")
+contacts = Repository(models.Contact)
+social_links = Repository(models.SocialLink, "social_links")
+blogs = Repository(models.Blog, "blog")
 
 # About CRUD
 def get_about(db: Session):
     return db.query(models.About).first()
 
 def create_about(db: Session, about: schemas.AboutCreate):
-    db_about = models.About(**about.dict())
-    db.add(db_about)
-    db.commit()
-    db.refresh(db_about)
-    return db_about
+    return abouts.create(db, about.dict())
 
 def update_about(db: Session, about_id: int, about: schemas.AboutUpdate):
-    db_about = db.query(models.About).filter(models.About.id == about_id).first()
-    if db_about:
-        for key, value in about.dict(exclude_unset=True).items():
-            setattr(db_about, key, value)
-        db.commit()
-        db.refresh(db_about)
-    return db_about
+    return abouts.update(db, about_id, about.dict(exclude_unset=True))
 
 # Stack CRUD
 def get_stacks(db: Session, skip: int = 0, limit: int = 100):
@@ -31,28 +40,13 @@ def get_stack(db: Session, stack_id: int):
     return db.query(models.Stack).filter(models.Stack.id == stack_id).first()
 
 def create_stack(db: Session, stack: schemas.StackCreate):
-    db_stack = models.Stack(**stack.dict())
-    db.add(db_stack)
-    db.commit()
-    db.refresh(db_stack)
-    return db_stack
+    return stacks.create(db, stack.dict())
 
 def update_stack(db: Session, stack_id: int, stack: schemas.StackUpdate):
-    db_stack = db.query(models.Stack).filter(models.Stack.id == stack_id).first()
-    if db_stack:
-        for key, value in stack.dict(exclude_unset=True).items():
-            setattr(db_stack, key, value)
-        db.commit()
-        db.refresh(db_stack)
-    return db_stack
+    return stacks.update(db, stack_id, stack.dict(exclude_unset=True))
 
 def delete_stack(db: Session, stack_id: int):
-    db_stack = db.query(models.Stack).filter(models.Stack.id == stack_id).first()
-    if db_stack:
-        db.delete(db_stack)
-        db.commit()
-        return True
-    return False
+    return stacks.delete(db, stack_id)
 
 # Project CRUD
 def get_projects(db: Session, skip: int = 0, limit: int = 100, featured_only: bool = False):
@@ -65,28 +59,13 @@ def get_project(db: Session, project_id: int):
     return db.query(models.Project).filter(models.Project.id == project_id).first()
 
 def create_project(db: Session, project: schemas.ProjectCreate):
-    db_project = models.Project(**project.dict())
-    db.add(db_project)
-    db.commit()
-    db.refresh(db_project)
-    return db_project
+    return projects.create(db, project.dict())
 
 def update_project(db: Session, project_id: int, project: schemas.ProjectUpdate):
-    db_project = db.query(models.Project).filter(models.Project.id == project_id).first()
-    if db_project:
-        for key, value in project.dict(exclude_unset=True).items():
-            setattr(db_project, key, value)
-        db.commit()
-        db.refresh(db_project)
-    return db_project
+    return projects.update(db, project_id, project.dict(exclude_unset=True))
 
 def delete_project(db: Session, project_id: int):
-    db_project = db.query(models.Project).filter(models.Project.id == project_id).first()
-    if db_project:
-        db.delete(db_project)
-        db.commit()
-        return True
-    return False
+    return projects.delete(db, project_id)
 
 # Experience CRUD
 def get_experiences(db: Session, skip: int = 0, limit: int = 100):
@@ -101,28 +80,13 @@ def get_experience(db: Session, experience_id: int):
     return db.query(models.Experience).filter(models.Experience.id == experience_id).first()
 
 def create_experience(db: Session, experience: schemas.ExperienceCreate):
-    db_experience = models.Experience(**experience.dict())
-    db.add(db_experience)
-    db.commit()
-    db.refresh(db_experience)
-    return db_experience
+    return experiences.create(db, experience.dict())
 
 def update_experience(db: Session, experience_id: int, experience: schemas.ExperienceUpdate):
-    db_experience = db.query(models.Experience).filter(models.Experience.id == experience_id).first()
-    if db_experience:
-        for key, value in experience.dict(exclude_unset=True).items():
-            setattr(db_experience, key, value)
-        db.commit()
-        db.refresh(db_experience)
-    return db_experience
+    return experiences.update(db, experience_id, experience.dict(exclude_unset=True))
 
 def delete_experience(db: Session, experience_id: int):
-    db_experience = db.query(models.Experience).filter(models.Experience.id == experience_id).first()
-    if db_experience:
-        db.delete(db_experience)
-        db.commit()
-        return True
-    return False
+    return experiences.delete(db, experience_id)
 
 # Education CRUD
 def get_educations(db: Session, skip: int = 0, limit: int = 100):
@@ -132,58 +96,60 @@ def get_education(db: Session, education_id: int):
     return db.query(models.Education).filter(models.Education.id == education_id).first()
 
 def create_education(db: Session, education: schemas.EducationCreate):
-    db_education = models.Education(**education.dict())
-    db.add(db_education)
-    db.commit()
-    db.refresh(db_education)
-    return db_education
+    return educations.create(db, education.dict())
 
 def update_education(db: Session, education_id: int, education: schemas.EducationUpdate):
-    db_education = db.query(models.Education).filter(models.Education.id == education_id).first()
-    if db_education:
-        for key, value in education.dict(exclude_unset=True).items():
-            setattr(db_education, key, value)
-        db.commit()
-        db.refresh(db_education)
-    return db_education
+    return educations.update(db, education_id, education.dict(exclude_unset=True))
 
 def delete_education(db: Session, education_id: int):
-    db_education = db.query(models.Education).filter(models.Education.id == education_id).first()
-    if db_education:
-        db.delete(db_education)
-        db.commit()
-        return True
-    return False
+    return educations.delete(db, education_id)
 
 # Contact CRUD
-def get_contacts(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(models.Contact).order_by(models.Contact.created_at.desc()).offset(skip).limit(limit).all()
+def get_contacts(db: Session, skip: int = 0, limit: int = 100, after: Optional[str] = None):
+    query = newest_first(db.query(models.Contact), models.Contact, after)
+    if skip:
+        query = query.offset(skip)
+    return query.limit(limit).all()
 
 def get_contact(db: Session, contact_id: int):
     return db.query(models.Contact).filter(models.Contact.id == contact_id).first()
 
 def create_contact(db: Session, contact: schemas.ContactCreate):
-    db_contact = models.Contact(**contact.dict())
-    db.add(db_contact)
+    return contacts.create(db, contact.dict())
+
+def insert_contacts(db: Session, records: List[dict]):
+    """
+    Insert submissions from the contact queue in one statement. Ones that are
+    already in the table, replayed from the queue's log after a crash, are
+    skipped.
+    """
+    records = {record["submission_id"]: record for record in records}
+    existing = set(db.scalars(
+        select(models.Contact.submission_id).where(models.Contact.submission_id.in_(list(records)))
+    ))
+    rows = [
+        {
+            "submission_id": submission_id,
+            "name": record["name"],
+            "email": record["email"],
+            "subject": record.get("subject"),
+            "message": record["message"],
+            "is_read": False,
+            "created_at": datetime.fromisoformat(record["created_at"]),
+        }
+        for submission_id, record in records.items()
+        if submission_id not in existing
+    ]
+    if rows:
+        db.execute(insert(models.Contact), rows)
     db.commit()
-    db.refresh(db_contact)
-    return db_contact
+    return len(rows)
 
 def mark_contact_read(db: Session, contact_id: int):
-    db_contact = db.query(models.Contact).filter(models.Contact.id == contact_id).first()
-    if db_contact:
-        db_contact.is_read = True
-        db.commit()
-        db.refresh(db_contact)
-    return db_contact
+    return contacts.update(db, contact_id, {"is_read": True})
 
 def delete_contact(db: Session, contact_id: int):
-    db_contact = db.query(models.Contact).filter(models.Contact.id == contact_id).first()
-    if db_contact:
-        db.delete(db_contact)
-        db.commit()
-        return True
-    return False
+    return contacts.delete(db, contact_id)
 
 # Social Link CRUD
 def get_social_links(db: Session):
@@ -193,28 +159,26 @@ def get_social_link(db: Session, link_id: int):
     return db.query(models.SocialLink).filter(models.SocialLink.id == link_id).first()
 
 def create_social_link(db: Session, link: schemas.SocialLinkCreate):
-    db_link = models.SocialLink(**link.dict())
-    db.add(db_link)
-    db.commit()
-    db.refresh(db_link)
-    return db_link
+    return social_links.create(db, link.dict())
 
 def update_social_link(db: Session, link_id: int, link: schemas.SocialLinkUpdate):
-    db_link = db.query(models.SocialLink).filter(models.SocialLink.id == link_id).first()
-    if db_link:
-        for key, value in link.dict(exclude_unset=True).items():
-            setattr(db_link, key, value)
-        db.commit()
-        db.refresh(db_link)
-    return db_link
+    return social_links.update(db, link_id, link.dict(exclude_unset=True))
 
 def delete_social_link(db: Session, link_id: int):
-    db_link = db.query(models.SocialLink).filter(models.SocialLink.id == link_id).first()
-    if db_link:
-        db.delete(db_link)
-        db.commit()
-        return True
-    return False
+    return social_links.delete(db, link_id)
+
+# Portfolio (home page aggregate)
+def get_portfolio(db: Session):
+    # All sections share the caller's session, so the home page costs one
+    # pooled connection and one query per table
+    return {
+        "about": get_about(db),
+        "stack": get_stacks(db),
+        "projects": get_projects(db),
+        "experience": get_experiences(db),
+        "education": get_educations(db),
+        "social_links": get_social_links(db),
+    }
 
 # Admin CRUD
 def get_admin_by_username(db: Session, username: str):
@@ -227,12 +191,129 @@ def create_admin(db: Session, username: str, hashed_password: str):
     db.refresh(db_admin)
     return db_admin
 
+# Tag CRUD
+def parse_tags(tags: Optional[str]) -> List[str]:
+    # "Python, FastAPI,python" -> ["python", "fastapi"]
+    names = []
+    for name in (tags or "").split(","):
+        name = name.strip().lower()[:100]
+        if name and name not in names:
+            names.append(name)
+    return names
+
+def set_blog_tags(db: Session, blog_id: int, tags: Optional[str]):
+    # Rewrites the blog_tags rows for one post; the caller commits
+    set_tags_for_blogs(db, {blog_id: tags})
+
+def set_tags_for_blogs(db: Session, tags_by_blog: Dict[int, Optional[str]]):
+    # Same for many posts at once, in a fixed number of statements
+    names_by_blog = {blog_id: parse_tags(tags) for blog_id, tags in tags_by_blog.items()}
+    db.execute(delete(models.blog_tags).where(models.blog_tags.c.blog_id.in_(list(names_by_blog))))
+    names = sorted({name for blog_names in names_by_blog.values() for name in blog_names})
+    if not names:
+        return
+
+    tag_ids = dict(db.query(models.Tag.name, models.Tag.id).filter(models.Tag.name.in_(names)).all())
+    missing = [name for name in names if name not in tag_ids]
+    if missing:
+        # A concurrent request may create the same tag first; skip those
+        # names instead of failing on the unique constraint. RETURNING
+        # carries the name, so the row order does not matter and SQLite can
+        # batch the insert too
+        dialect = db.get_bind().dialect.name
+        statement = insert(models.Tag)
+        if dialect in ("postgresql", "sqlite"):
+            statement = (postgresql if dialect == "postgresql" else sqlite).insert(models.Tag)
+            statement = statement.on_conflict_do_nothing(index_elements=[models.Tag.name])
+        created = db.execute(
+            statement.returning(models.Tag.name, models.Tag.id),
+            [{"name": name} for name in missing],
+        )
+        tag_ids.update(created.tuples().all())
+        # Skipped rows return nothing, so look up the other request's ids
+        raced = [name for name in missing if name not in tag_ids]
+        if raced:
+            tag_ids.update(db.query(models.Tag.name, models.Tag.id).filter(models.Tag.name.in_(raced)).all())
+
+    db.execute(insert(models.blog_tags), [
+        {"blog_id": blog_id, "tag_id": tag_ids[name]}
+        for blog_id, blog_names in names_by_blog.items() for name in blog_names
+    ])
+
+def get_tag_counts(db: Session):
+    # Published post count per tag, most used first
+    post_count = func.count(models.blog_tags.c.blog_id).label("count")
+    return (
+        db.query(models.Tag.name, post_count)
+        .join(models.blog_tags, models.blog_tags.c.tag_id == models.Tag.id)
+        .join(models.Blog, models.Blog.id == models.blog_tags.c.blog_id)
+        .filter(models.Blog.published == True)
+        .group_by(models.Tag.name)
+        .order_by(post_count.desc(), models.Tag.name)
+        .all()
+    )
+
 # Blog CRUD
-def get_blogs(db: Session, skip: int = 0, limit: int = 100, published_only: bool = False):
-    query = db.query(models.Blog)
+def get_blogs(db: Session, skip: int = 0, limit: int = 100, published_only: bool = False, after: Optional[str] = None, tag: Optional[str] = None):
+    # Listings never load the post body; reading `content` on these rows
+    # raises instead of issuing one lazy SELECT per post
+    query = db.query(models.Blog).options(defer(models.Blog.content, raiseload=True))
     if published_only:
         query = query.filter(models.Blog.published == True)
-    return query.order_by(models.Blog.created_at.desc()).offset(skip).limit(limit).all()
+    if tag:
+        tagged = (
+            select(models.blog_tags.c.blog_id)
+            .join(models.Tag, models.Tag.id == models.blog_tags.c.tag_id)
+            .where(models.Tag.name == tag.strip().lower())
+        )
+        query = query.filter(models.Blog.id.in_(tagged))
+    query = newest_first(query, models.Blog, after)
+    if skip:
+        query = query.offset(skip)
+    return query.limit(limit).all()
+
+def search_blogs(db: Session, q: str, limit: int = 20):
+    # Ranked full-text search over published posts; see models.BLOG_SEARCH_DDL
+    terms = re.findall(r"\w+", q)
+    if not terms:
+        return []
+
+    query = (
+        db.query(models.Blog)
+        .options(defer(models.Blog.content, raiseload=True))
+        .filter(models.Blog.published == True)
+    )
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        search_vector = literal_column("blog.search_vector")
+        ts_query = func.websearch_to_tsquery("english", q)
+        query = query.filter(search_vector.op("@@")(ts_query)).order_by(
+            func.ts_rank_cd(search_vector, ts_query).desc(), models.Blog.created_at.desc()
+        )
+    elif dialect == "sqlite":
+        blog_fts = table("blog_fts", column("rowid"), column("blog_fts"))
+        # Quote each term so user input can't inject FTS5 query syntax
+        match = " ".join('"%s"' % term for term in terms)
+        query = (
+            query.join(blog_fts, blog_fts.c.rowid == models.Blog.id)
+            .filter(blog_fts.c.blog_fts.op("MATCH")(match))
+            # bm25 weights follow the column order: title, tags, excerpt, content
+            .order_by(func.bm25(literal_column("blog_fts"), 10.0, 5.0, 5.0, 1.0), models.Blog.created_at.desc())
+        )
+    else:
+        # No full-text index on other databases: fall back to a scan
+        for term in terms:
+            pattern = f"%{term}%"
+            query = query.filter(or_(
+                models.Blog.title.ilike(pattern),
+                models.Blog.tags.ilike(pattern),
+                models.Blog.excerpt.ilike(pattern),
+                models.Blog.content.ilike(pattern),
+            ))
+        query = query.order_by(models.Blog.created_at.desc())
+
+    return query.limit(limit).all()
 
 def get_blog_by_id(db: Session, blog_id: int):
     return db.query(models.Blog).filter(models.Blog.id == blog_id).first()
@@ -241,47 +322,217 @@ def get_blog_by_slug(db: Session, slug: str):
     return db.query(models.Blog).filter(models.Blog.slug == slug).first()
 
 def create_blog(db: Session, blog: schemas.BlogCreate):
-    from datetime import datetime
     blog_data = blog.dict()
 
     # Set published_at if publishing for the first time
     if blog_data.get('published') and not blog_data.get('published_at'):
         blog_data['published_at'] = datetime.now()
 
-    db_blog = models.Blog(**blog_data)
-    db.add(db_blog)
-    db.commit()
-    db.refresh(db_blog)
-    return db_blog
+    db_blog = db.scalars(insert(models.Blog).values(**blog_data).returning(models.Blog)).one()
+    set_blog_tags(db, db_blog.id, db_blog.tags)
+    return blogs.commit(db, db_blog)
 
 def update_blog(db: Session, blog_id: int, blog: schemas.BlogUpdate):
-    from datetime import datetime
-    db_blog = db.query(models.Blog).filter(models.Blog.id == blog_id).first()
-    if db_blog:
-        update_data = blog.dict(exclude_unset=True)
-
-        # Set published_at if publishing for the first time
-        if update_data.get('published') and not db_blog.published:
-            update_data['published_at'] = datetime.now()
-
-        for key, value in update_data.items():
-            setattr(db_blog, key, value)
-        db.commit()
-        db.refresh(db_blog)
-    return db_blog
+    update_data = blog.dict(exclude_unset=True)
+    if not update_data:
+        return blogs.get(db, blog_id)
+
+    # Set published_at if publishing for the first time, decided in SQL
+    # from the row's current state rather than a prior SELECT
+    if update_data.get('published'):
+        update_data['published_at'] = case(
+            (models.Blog.published.is_(True), models.Blog.published_at), else_=datetime.now()
+        )
+
+    db_blog = db.scalars(
+        update(models.Blog)
+        .where(models.Blog.id == blog_id)
+        .values(**update_data)
+        .returning(models.Blog)
+        .execution_options(synchronize_session="fetch")
+    ).one_or_none()
+    if db_blog is None:
+        db.rollback()
+        return None
+    if "tags" in update_data:
+        set_blog_tags(db, db_blog.id, db_blog.tags)
+    return blogs.commit(db, db_blog)
 
 def delete_blog(db: Session, blog_id: int):
-    db_blog = db.query(models.Blog).filter(models.Blog.id == blog_id).first()
-    if db_blog:
-        db.delete(db_blog)
-        db.commit()
-        return True
-    return False
+    # SQLite doesn't enforce ON DELETE CASCADE unless foreign keys are on
+    db.execute(delete(models.blog_tags).where(models.blog_tags.c.blog_id == blog_id))
+    return blogs.delete(db, blog_id)
+
+def add_blog_views(db: Session, counts: Dict[int, int]):
+    # One executemany of "views = views + n" keeps the increment in SQL, so
+    # concurrent flushes from several workers never lose updates
+    if not counts:
+        return
+    blog = models.Blog.__table__
+    db.execute(
+        update(blog)
+        .where(blog.c.id == bindparam("blog_id"))
+        .values(views=blog.c.views + bindparam("increment")),
+        [{"blog_id": blog_id, "increment": n} for blog_id, n in counts.items()],
+    )
+    db.commit()
 
-def increment_blog_views(db: Session, blog_id: int):
-    db_blog = db.query(models.Blog).filter(models.Blog.id == blog_id).first()
-    if db_blog:
-        db_blog.views += 1
+# Bulk admin changes
+class BulkValidationError(ValueError):
+    """Raised before anything is written; `errors` has one entry per bad item"""
+
+    def __init__(self, errors):
+        super().__init__(errors)
+        self.errors = errors
+
+# section -> (model, create schema, update schema, cache table)
+BULK_SECTIONS = {
+    "stack": (models.Stack, schemas.StackCreate, schemas.StackUpdate, "stack"),
+    "projects": (models.Project, schemas.ProjectCreate, schemas.ProjectUpdate, "projects"),
+    "experience": (models.Experience, schemas.ExperienceCreate, schemas.ExperienceUpdate, "experience"),
+    "education": (models.Education, schemas.EducationCreate, schemas.EducationUpdate, "education"),
+    "social_links": (models.SocialLink, schemas.SocialLinkCreate, schemas.SocialLinkUpdate, "social_links"),
+    "blogs": (models.Blog, schemas.BlogCreate, schemas.BlogUpdate, "blog"),
+}
+
+def _item_error(operation: str, index: int, errors):
+    return {"operation": operation, "index": index, "errors": errors}
+
+def _schema_errors(exc: ValidationError):
+    return [{"loc": list(error["loc"]), "msg": error["msg"], "type": error["type"]} for error in exc.errors()]
+
+def _validate_bulk(db: Session, model, create_schema, update_schema, changes: schemas.BulkRequest):
+    errors = []
+
+    creates = []
+    for index, item in enumerate(changes.create):
+        try:
+            creates.append(create_schema.model_validate(item).dict())
+        except ValidationError as e:
+            errors.append(_item_error("create", index, _schema_errors(e)))
+
+    updates = []  # (index, id, changed fields)
+    for index, item in enumerate(changes.update):
+        fields = dict(item)
+        row_id = fields.pop("id", None)
+        if not isinstance(row_id, int) or isinstance(row_id, bool):
+            errors.append(_item_error("update", index, [{"loc": ["id"], "msg": "An integer id is required", "type": "missing"}]))
+            continue
+        try:
+            updates.append((index, row_id, update_schema.model_validate(fields).dict(exclude_unset=True)))
+        except ValidationError as e:
+            errors.append(_item_error("update", index, _schema_errors(e)))
+
+    # One query tells which of the referenced rows exist
+    referenced = {row_id for _, row_id, _ in updates} | set(changes.delete)
+    existing = set(db.scalars(select(model.id).where(model.id.in_(referenced)))) if referenced else set()
+
+    deletes = set(changes.delete)
+    updated = set()
+    for index, row_id, _ in updates:
+        if row_id not in existing:
+            errors.append(_item_error("update", index, [{"loc": ["id"], "msg": f"No row with id {row_id}", "type": "not_found"}]))
+        elif row_id in updated or row_id in deletes:
+            errors.append(_item_error("update", index, [{"loc": ["id"], "msg": f"Row {row_id} appears more than once", "type": "duplicate"}]))
+        updated.add(row_id)
+    for index, row_id in enumerate(changes.delete):
+        if row_id not in existing:
+            errors.append(_item_error("delete", index, [{"loc": [], "msg": f"No row with id {row_id}", "type": "not_found"}]))
+
+    return creates, updates, sorted(deletes), errors
+
+def _check_blog_slugs(db: Session, creates, updates, deletes, errors):
+    # Slugs are unique: compare the slugs the batch would leave behind
+    renamed = {row_id: fields["slug"] for _, row_id, fields in updates if "slug" in fields}
+    wanted = [blog["slug"] for blog in creates] + list(renamed.values())
+    owners = {}
+    for row_id, slug in db.execute(select(models.Blog.id, models.Blog.slug).where(models.Blog.slug.in_(wanted))):
+        if row_id not in deletes and row_id not in renamed:
+            owners[slug] = row_id
+
+    for index, row_id, fields in updates:
+        if "slug" in fields:
+            if fields["slug"] in owners and owners[fields["slug"]] != row_id:
+                errors.append(_item_error("update", index, [{"loc": ["slug"], "msg": "Slug already exists", "type": "duplicate"}]))
+            owners.setdefault(fields["slug"], row_id)
+    for index, blog in enumerate(creates):
+        if blog["slug"] in owners:
+            errors.append(_item_error("create", index, [{"loc": ["slug"], "msg": "Slug already exists", "type": "duplicate"}]))
+        owners.setdefault(blog["slug"], None)
+
+def bulk_apply(db: Session, section: str, changes: schemas.BulkRequest) -> schemas.BulkResult:
+    """
+    Apply a batch of creates, updates and deletes to one section in a single
+    transaction, as one executemany per operation. Every item is validated
+    first; if any fails, BulkValidationError lists them and nothing is written.
+    """
+    model, create_schema, update_schema, cache_table = BULK_SECTIONS[section]
+    creates, updates, deletes, errors = _validate_bulk(db, model, create_schema, update_schema, changes)
+    if model is models.Blog:
+        _check_blog_slugs(db, creates, updates, set(deletes), errors)
+    if errors:
+        raise BulkValidationError(errors)
+
+    if model is models.Blog:
+        # Set published_at for posts published for the first time
+        now = datetime.now()
+        for blog in creates:
+            if blog.get("published") and not blog.get("published_at"):
+                blog["published_at"] = now
+        publishing = [row_id for _, row_id, fields in updates if fields.get("published")]
+        if publishing:
+            already = set(db.scalars(select(models.Blog.id).where(models.Blog.id.in_(publishing), models.Blog.published.is_(True))))
+            for _, row_id, fields in updates:
+                if fields.get("published") and row_id not in already:
+                    fields["published_at"] = now
+
+    try:
+        if deletes:
+            if model is models.Blog:
+                db.execute(delete(models.blog_tags).where(models.blog_tags.c.blog_id.in_(deletes)))
+            db.execute(delete(model).where(model.id.in_(deletes)), execution_options={"synchronize_session": False})
+        changed = [{"id": row_id, **fields} for _, row_id, fields in updates if fields]
+        if changed:
+            db.execute(update(model), changed)
+        created = []
+        if creates:
+            # One multi-row INSERT ... RETURNING on PostgreSQL; SQLite cannot
+            # promise the RETURNING order, so SQLAlchemy sends it row by row
+            created = list(db.scalars(insert(model).returning(model.id, sort_by_parameter_order=True), creates))
+        if model is models.Blog:
+            tags = {blog_id: blog["tags"] for blog_id, blog in zip(created, creates)}
+            tags.update((row_id, fields["tags"]) for _, row_id, fields in updates if "tags" in fields)
+            if tags:
+                set_tags_for_blogs(db, tags)
         db.commit()
-        db.refresh(db_blog)
-    return db_blog
+    except Exception:
+        db.rollback()
+        raise
+
+    response_cache.invalidate(cache_table)
+    return schemas.BulkResult(created=created, updated=[row_id for _, row_id, _ in updates], deleted=deletes)
+
+# Reordering
+ORDERED_SECTIONS = ["stack", "projects", "experience", "education", "social_links"]
+
+def reorder(db: Session, section: str, ids: List[int]) -> List[int]:
+    """
+    Set order_index to each id's position in `ids` (starting at 1) with one
+    UPDATE ... SET order_index = CASE id WHEN ... END. Returns the ids that
+    do not exist; in that case nothing is changed.
+    """
+    model, _, _, cache_table = BULK_SECTIONS[section]
+    positions = {row_id: position for position, row_id in enumerate(ids, start=1)}
+    result = db.execute(
+        update(model)
+        .where(model.id.in_(ids))
+        .values(order_index=case(positions, value=model.id))
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != len(ids):
+        db.rollback()
+        existing = set(db.scalars(select(model.id).where(model.id.in_(ids))))
+        return [row_id for row_id in ids if row_id not in existing]
+    db.commit()
+    response_cache.invalidate(cache_table)
+    return []
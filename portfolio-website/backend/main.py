@@ -1,8 +1,10 @@
 from fastapi import FastAPI, Depends, HTTPException, status, Request, Response, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from datetime import timedelta
 import os
 from dotenv import load_dotenv
@@ -13,22 +15,39 @@ from slowapi.errors import RateLimitExceeded
 import models
 import schemas
 import crud
-from database import engine, get_db
+import database
+from database import engine, SessionLocal, get_db, get_db_runner, DbRunner, pool_monitors
+from bootstrap_admin import bootstrap_admin
+from cache import response_cache, CachedPayload, etag_matches, to_json_bytes
+from compression import CompressionMiddleware, negotiate, COMPRESSION_ENABLED, COMPRESSION_MIN_SIZE
+from blog_views import blog_view_counter
+from contact_queue import contact_queue, ContactQueueFull
+from pagination import InvalidCursor, next_cursor
+from password_pool import password_pool, PasswordPoolBusy
+from metrics import metrics, MetricsMiddleware, route_label, METRICS_ENABLED, METRICS_TOKEN
+from sql_profiler import SqlProfilerMiddleware, instrument_engine
+from rate_limit_storage import RATE_LIMIT_STORAGE_URI, RATE_LIMIT_STRATEGY
 from auth import (
-    verify_password, 
-    get_password_hash, 
     create_access_token, 
     get_current_admin,
+    token_cache,
     ACCESS_TOKEN_EXPIRE_MINUTES
 )
 
 load_dotenv()
 
+# Serverless / autoscaled deployments: leave the schema to `alembic upgrade
+# head` and the admin user to bootstrap_admin.py, so booting a worker makes
+# no database round-trips at all
+FAST_STARTUP = os.getenv("FAST_STARTUP", "false").lower() == "true"
+
 # Create database tables
-models.Base.metadata.create_all(bind=engine)
+if not FAST_STARTUP:
+    models.Base.metadata.create_all(bind=engine)
 
-# Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address)
+# Initialize rate limiter; counters live in a SQLite file shared by all
+# workers on the host, so "5/minute" means 5 per client, not 5 per worker
+limiter = Limiter(key_func=get_remote_address, storage_uri=RATE_LIMIT_STORAGE_URI, strategy=RATE_LIMIT_STRATEGY)
 
 app = FastAPI(
     title="Portfolio API",
@@ -38,7 +57,19 @@ app = FastAPI(
 
 # Add rate limiter to app state
 app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
+@app.exception_handler(RateLimitExceeded)
+async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
+    metrics.rate_limited(route_label(request.scope))
+    return _rate_limit_exceeded_handler(request, exc)
+
+@app.exception_handler(InvalidCursor)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursor):
+    return JSONResponse(status_code=400, content={"detail": "Invalid pagination cursor"})
+
+@app.exception_handler(crud.BulkValidationError)
+async def bulk_validation_handler(request: Request, exc: crud.BulkValidationError):
+    return JSONResponse(status_code=422, content={"detail": exc.errors})
 
 # Security Headers Middleware
 @app.middleware("http")
@@ -70,60 +101,168 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["Content-Type", "Authorization", "Set-Cookie"],
-    expose_headers=["Set-Cookie"],
+    expose_headers=["Set-Cookie", "X-Next-Cursor"],
 )
 
-# Initialize default admin on startup
+# gzip / Brotli for responses above COMPRESSION_MIN_SIZE; cached public
+# responses arrive already compressed and pass through
+if COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
+# Request metrics for /metrics; added after the middlewares above so it also
+# times them
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+
+# Per-request SQL statement counts, read by the metrics middleware, plus
+# Server-Timing and N+1 / slow query warnings outside production
+instrument_engine(engine)
+if database.DATABASE_ASYNC:
+    instrument_engine(database.async_engine.sync_engine)
+app.add_middleware(SqlProfilerMiddleware)
+
+# Flush buffered blog views periodically, and once more on shutdown
 @app.on_event("startup")
-async def startup_event():
-    db = next(get_db())
+async def start_blog_view_counter():
+    blog_view_counter.start()
 
-    # Security: Force users to set credentials in .env
-    admin_username = os.getenv("ADMIN_USERNAME")
-    admin_password = os.getenv("ADMIN_PASSWORD")
+@app.on_event("shutdown")
+async def stop_blog_view_counter():
+    await blog_view_counter.stop()
 
-    if not admin_username or not admin_password:
-        print("⚠️  WARNING: ADMIN_USERNAME and ADMIN_PASSWORD must be set in .env file!")
-        print("⚠️  Admin panel will not be accessible until credentials are configured.")
-        return
+# Contact submissions are logged to disk on the request path and inserted in
+# batches; the log is replayed on startup and drained on shutdown
+@app.on_event("startup")
+async def start_contact_queue():
+    contact_queue.start()
 
-    if admin_password in ["changeme123", "admin", "password", "123456"]:
-        raise ValueError(
-            "🚨 SECURITY ERROR: Weak password detected! "
-            "Set a strong ADMIN_PASSWORD in .env (min 12 chars, mix of upper, lower, numbers, symbols)"
-        )
+@app.on_event("shutdown")
+async def stop_contact_queue():
+    await contact_queue.stop()
+
+@app.on_event("startup")
+async def start_password_pool():
+    # In fast-startup mode the workers are spawned by the first login
+    if not FAST_STARTUP:
+        password_pool.start()
+        # Awaited, not run here: the hash is computed in a pool worker
+        await password_pool.prepare()
 
-    admin = crud.get_admin_by_username(db, admin_username)
-    if not admin:
-        hashed_password = get_password_hash(admin_password)
-        crud.create_admin(db, admin_username, hashed_password)
-        print(f"✅ Admin created: {admin_username}")
-        print("🔒 Password is securely hashed in database")
+@app.on_event("shutdown")
+async def stop_password_pool():
+    password_pool.shutdown()
+
+# Initialize default admin on startup
+@app.on_event("startup")
+async def startup_event():
+    if FAST_STARTUP:
+        # Run `python bootstrap_admin.py` once per deployment instead
+        return
+
+    db = SessionLocal()
+    try:
+        bootstrap_admin(db)
+    finally:
+        db.close()
 
 # Root endpoint
 @app.get("/")
 def read_root():
     return {"message": "Portfolio API is running", "version": "1.0.0"}
 
+# Prometheus scrape target. Set METRICS_TOKEN to require it as a bearer token;
+# production serves it only with a token, so it is never public there.
+@app.get("/metrics", include_in_schema=False)
+def get_metrics(request: Request):
+    if not METRICS_ENABLED or (not METRICS_TOKEN and os.getenv("ENVIRONMENT") == "production"):
+        raise HTTPException(status_code=404, detail="Not Found")
+    if METRICS_TOKEN and request.headers.get("Authorization") != f"Bearer {METRICS_TOKEN}":
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    return PlainTextResponse(metrics.render() + contact_queue.render_metrics(), media_type="text/plain; version=0.0.4")
+
 # ============= PUBLIC ROUTES =============
 
+# Cached responses hold validated schemas rather than ORM rows, so they stay
+# usable after the request's session is closed
+def _validate(schema, row):
+    return schema.model_validate(row) if row is not None else None
+
+def _validate_list(schema, rows):
+    return [schema.model_validate(row) for row in rows]
+
+# Public read routes are async: a cache hit is answered on the event loop,
+# and only a miss runs `loader(session)` through the DbRunner (see database.py)
+async def _cached_payload(db: DbRunner, key, tables, loader):
+    return await response_cache.aget_or_set(
+        key, tables, lambda: db.run(lambda session: CachedPayload(loader(session)))
+    )
+
+# Answer 304 when the client already holds the current body; otherwise send
+# the bytes serialized when the entry was cached. Returning a Response skips
+# FastAPI's per-request response_model validation and encoding: the data was
+# validated against the same schemas when it was loaded.
+def _conditional(request: Request, payload: CachedPayload, headers: Optional[dict] = None):
+    headers = {**(headers or {}), "ETag": payload.etag, "Cache-Control": "no-cache"}
+    if len(payload.body) >= COMPRESSION_MIN_SIZE:
+        headers["Vary"] = "Accept-Encoding"
+    if etag_matches(request.headers.get("if-none-match"), payload.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    # Large bodies go out in the client's preferred encoding, compressed once
+    # per cache entry rather than by CompressionMiddleware on every hit
+    encoding = negotiate(request.headers.get("accept-encoding")) if "Vary" in headers else None
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        return Response(content=payload.encoded(encoding), media_type="application/json", headers=headers)
+    return Response(content=payload.body, media_type="application/json", headers=headers)
+
+async def _cached_response(request: Request, db: DbRunner, key, tables, loader):
+    return _conditional(request, await _cached_payload(db, key, tables, loader))
+
+# Keyset pagination: lists stay plain arrays and the cursor for the next
+# page travels in a header, so existing clients paging with skip still work
+def _next_cursor_headers(rows, limit: int):
+    cursor = next_cursor(rows, limit)
+    return {"X-Next-Cursor": cursor} if cursor else {}
+
+def _set_next_cursor(response: Response, rows, limit: int):
+    response.headers.update(_next_cursor_headers(rows, limit))
+
+# Portfolio Route (all home page sections in one request)
+@app.get("/api/portfolio", response_model=schemas.Portfolio)
+async def get_portfolio(request: Request, db: DbRunner = Depends(get_db_runner)):
+    return await _cached_response(
+        request, db,
+        ("portfolio",),
+        ["about", "stack", "projects", "experience", "education", "social_links"],
+        lambda session: schemas.Portfolio.model_validate(crud.get_portfolio(session), from_attributes=True),
+    )
+
 # About Routes
 @app.get("/api/about", response_model=schemas.About)
-def get_about(db: Session = Depends(get_db)):
-    about = crud.get_about(db)
-    if not about:
+async def get_about(request: Request, db: DbRunner = Depends(get_db_runner)):
+    payload = await _cached_payload(
+        db, ("about",), ["about"],
+        lambda session: _validate(schemas.About, crud.get_about(session)),
+    )
+    if not payload.data:
         raise HTTPException(status_code=404, detail="About section not found")
-    return about
+    return _conditional(request, payload)
 
 # Stack Routes
 @app.get("/api/stack", response_model=List[schemas.Stack])
-def get_stacks(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return crud.get_stacks(db, skip=skip, limit=limit)
+async def get_stacks(request: Request, skip: int = 0, limit: int = 100, db: DbRunner = Depends(get_db_runner)):
+    return await _cached_response(
+        request, db, ("stack", skip, limit), ["stack"],
+        lambda session: _validate_list(schemas.Stack, crud.get_stacks(session, skip=skip, limit=limit)),
+    )
 
 # Project Routes
 @app.get("/api/projects", response_model=List[schemas.Project])
-def get_projects(featured: bool = False, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return crud.get_projects(db, skip=skip, limit=limit, featured_only=featured)
+async def get_projects(request: Request, featured: bool = False, skip: int = 0, limit: int = 100, db: DbRunner = Depends(get_db_runner)):
+    return await _cached_response(
+        request, db, ("projects", featured, skip, limit), ["projects"],
+        lambda session: _validate_list(schemas.Project, crud.get_projects(session, skip=skip, limit=limit, featured_only=featured)),
+    )
 
 @app.get("/api/projects/{project_id}", response_model=schemas.Project)
 def get_project(project_id: int, db: Session = Depends(get_db)):
@@ -134,37 +273,69 @@ def get_project(project_id: int, db: Session = Depends(get_db)):
 
 # Experience Routes
 @app.get("/api/experience", response_model=List[schemas.Experience])
-def get_experiences(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return crud.get_experiences(db, skip=skip, limit=limit)
+async def get_experiences(request: Request, skip: int = 0, limit: int = 100, db: DbRunner = Depends(get_db_runner)):
+    return await _cached_response(
+        request, db, ("experience", skip, limit), ["experience"],
+        lambda session: _validate_list(schemas.Experience, crud.get_experiences(session, skip=skip, limit=limit)),
+    )
 
 # Education Routes
 @app.get("/api/education", response_model=List[schemas.Education])
-def get_educations(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return crud.get_educations(db, skip=skip, limit=limit)
+async def get_educations(request: Request, skip: int = 0, limit: int = 100, db: DbRunner = Depends(get_db_runner)):
+    return await _cached_response(
+        request, db, ("education", skip, limit), ["education"],
+        lambda session: _validate_list(schemas.Education, crud.get_educations(session, skip=skip, limit=limit)),
+    )
 
 # Social Links Routes
 @app.get("/api/social-links", response_model=List[schemas.SocialLink])
-def get_social_links(db: Session = Depends(get_db)):
-    return crud.get_social_links(db)
+async def get_social_links(request: Request, db: DbRunner = Depends(get_db_runner)):
+    return await _cached_response(
+        request, db, ("social_links",), ["social_links"],
+        lambda session: _validate_list(schemas.SocialLink, crud.get_social_links(session)),
+    )
 
 # Contact Form Route (Rate Limited to prevent spam)
-@app.post("/api/contact", response_model=schemas.Contact, status_code=status.HTTP_201_CREATED)
+# Acknowledged once the submission is on disk; the row is written in the
+# background by contact_queue, so the request never waits for the database
+@app.post("/api/contact", response_model=schemas.ContactAccepted, status_code=status.HTTP_202_ACCEPTED)
 @limiter.limit("5/minute")
-def create_contact(request: Request, contact: schemas.ContactCreate, db: Session = Depends(get_db)):
-    return crud.create_contact(db, contact)
+def create_contact(request: Request, contact: schemas.ContactCreate):
+    try:
+        record = contact_queue.submit(contact)
+    except ContactQueueFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many messages waiting to be saved, try again shortly",
+            headers={"Retry-After": "5"},
+        )
+    return {"reference": record["submission_id"]}
 
 # ============= ADMIN AUTHENTICATION =============
 
 @app.post("/api/admin/login")
 @limiter.limit("5/minute")  # Prevent brute force attacks
-def login(
+async def login(
     request: Request,
     response: Response,
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: DbRunner = Depends(get_db_runner)
 ):
-    admin = crud.get_admin_by_username(db, form_data.username)
-    if not admin or not verify_password(form_data.password, admin.hashed_password):
+    admin = await db.run(crud.get_admin_by_username, form_data.username)
+    try:
+        # bcrypt runs in the password pool, off this worker's event loop and
+        # threadpool; unknown usernames cost the same as a wrong password
+        if admin:
+            valid = await password_pool.verify(form_data.password, admin.hashed_password)
+        else:
+            valid = await password_pool.verify_unknown(form_data.password)
+    except PasswordPoolBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress, try again shortly",
+            headers={"Retry-After": "1"},
+        )
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -196,6 +367,30 @@ def login(
 def verify_admin(current_admin: str = Depends(get_current_admin)):
     return {"username": current_admin, "authenticated": True}
 
+# ============= ADMIN DIAGNOSTICS =============
+
+@app.get("/api/admin/diagnostics/cache")
+def get_cache_diagnostics(current_admin: str = Depends(get_current_admin)):
+    return response_cache.stats()
+
+@app.get("/api/admin/diagnostics/tokens")
+def get_token_cache_diagnostics(current_admin: str = Depends(get_current_admin)):
+    return token_cache.stats()
+
+@app.get("/api/admin/diagnostics/passwords")
+def get_password_pool_diagnostics(current_admin: str = Depends(get_current_admin)):
+    return password_pool.stats()
+
+@app.get("/api/admin/diagnostics/contacts")
+def get_contact_queue_diagnostics(current_admin: str = Depends(get_current_admin)):
+    return contact_queue.stats()
+
+@app.get("/api/admin/diagnostics/pool")
+def get_pool_diagnostics(current_admin: str = Depends(get_current_admin)):
+    # Per worker process: multiply by the uvicorn worker count when sizing
+    # against the database's max_connections
+    return {name: monitor.stats() for name, monitor in pool_monitors.items()}
+
 # ============= ADMIN PROTECTED ROUTES =============
 
 # About Admin Routes
@@ -374,15 +569,82 @@ def delete_social_link_admin(
         raise HTTPException(status_code=404, detail="Social link not found")
     return None
 
+# Bulk Admin Routes
+# Each takes {"create": [...], "update": [{"id": ..., ...}], "delete": [ids]}
+# and applies it in one transaction; a 422 lists every invalid item and
+# nothing is written
+def _bulk_apply(db: Session, section: str, changes: schemas.BulkRequest):
+    try:
+        return crud.bulk_apply(db, section, changes)
+    except IntegrityError:
+        raise HTTPException(status_code=409, detail="Bulk change conflicts with existing data")
+
+@app.post("/api/admin/stack/bulk", response_model=schemas.BulkResult)
+def bulk_stack_admin(changes: schemas.BulkRequest, db: Session = Depends(get_db), current_admin: str = Depends(get_current_admin)):
+    return _bulk_apply(db, "stack", changes)
+
+@app.post("/api/admin/projects/bulk", response_model=schemas.BulkResult)
+def bulk_projects_admin(changes: schemas.BulkRequest, db: Session = Depends(get_db), current_admin: str = Depends(get_current_admin)):
+    return _bulk_apply(db, "projects", changes)
+
+@app.post("/api/admin/experience/bulk", response_model=schemas.BulkResult)
+def bulk_experience_admin(changes: schemas.BulkRequest, db: Session = Depends(get_db), current_admin: str = Depends(get_current_admin)):
+    return _bulk_apply(db, "experience", changes)
+
+@app.post("/api/admin/education/bulk", response_model=schemas.BulkResult)
+def bulk_education_admin(changes: schemas.BulkRequest, db: Session = Depends(get_db), current_admin: str = Depends(get_current_admin)):
+    return _bulk_apply(db, "education", changes)
+
+@app.post("/api/admin/social-links/bulk", response_model=schemas.BulkResult)
+def bulk_social_links_admin(changes: schemas.BulkRequest, db: Session = Depends(get_db), current_admin: str = Depends(get_current_admin)):
+    return _bulk_apply(db, "social_links", changes)
+
+@app.post("/api/admin/blogs/bulk", response_model=schemas.BulkResult)
+def bulk_blogs_admin(changes: schemas.BulkRequest, db: Session = Depends(get_db), current_admin: str = Depends(get_current_admin)):
+    return _bulk_apply(db, "blogs", changes)
+
+# Reorder Admin Routes
+# Each takes {"ids": [...]} in display order and rewrites order_index for
+# all of them in one UPDATE
+def _reorder(db: Session, section: str, ids: List[int]):
+    missing = crud.reorder(db, section, ids)
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Not found: {missing}")
+    return {"message": f"Reordered {len(ids)} items"}
+
+@app.post("/api/admin/stack/reorder")
+def reorder_stack_admin(order: schemas.ReorderRequest, db: Session = Depends(get_db), current_admin: str = Depends(get_current_admin)):
+    return _reorder(db, "stack", order.ids)
+
+@app.post("/api/admin/projects/reorder")
+def reorder_projects_admin(order: schemas.ReorderRequest, db: Session = Depends(get_db), current_admin: str = Depends(get_current_admin)):
+    return _reorder(db, "projects", order.ids)
+
+@app.post("/api/admin/experience/reorder")
+def reorder_experience_admin(order: schemas.ReorderRequest, db: Session = Depends(get_db), current_admin: str = Depends(get_current_admin)):
+    return _reorder(db, "experience", order.ids)
+
+@app.post("/api/admin/education/reorder")
+def reorder_education_admin(order: schemas.ReorderRequest, db: Session = Depends(get_db), current_admin: str = Depends(get_current_admin)):
+    return _reorder(db, "education", order.ids)
+
+@app.post("/api/admin/social-links/reorder")
+def reorder_social_links_admin(order: schemas.ReorderRequest, db: Session = Depends(get_db), current_admin: str = Depends(get_current_admin)):
+    return _reorder(db, "social_links", order.ids)
+
 # Contact Admin Routes
 @app.get("/api/admin/contacts", response_model=List[schemas.Contact])
 def get_contacts_admin(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[str] = None,
     db: Session = Depends(get_db),
     current_admin: str = Depends(get_current_admin)
 ):
-    return crud.get_contacts(db, skip=skip, limit=limit)
+    contacts = crud.get_contacts(db, skip=skip, limit=limit, after=after)
+    _set_next_cursor(response, contacts, limit)
+    return contacts
 
 @app.put("/api/admin/contacts/{contact_id}/read", response_model=schemas.Contact)
 def mark_contact_read_admin(
@@ -415,35 +677,90 @@ def logout(response: Response):
 # ============= BLOG ROUTES =============
 
 # Public Blog Routes
-@app.get("/api/blogs", response_model=List[schemas.Blog])
-def get_blogs(
+@app.get("/api/blogs", response_model=List[schemas.BlogSummary])
+async def get_blogs(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     published_only: bool = True,
-    db: Session = Depends(get_db)
+    after: Optional[str] = None,
+    tag: Optional[str] = Query(None, max_length=100),
+    db: DbRunner = Depends(get_db_runner)
 ):
-    return crud.get_blogs(db, skip=skip, limit=limit, published_only=published_only)
-
-@app.get("/api/blogs/{slug}", response_model=schemas.Blog)
-def get_blog_by_slug(slug: str, db: Session = Depends(get_db)):
-    blog = crud.get_blog_by_slug(db, slug)
-    if not blog:
-        raise HTTPException(status_code=404, detail="Blog post not found")
+    # View counts in cached lists may lag by up to RESPONSE_CACHE_TTL seconds
+    payload = await _cached_payload(
+        db, ("blogs", skip, limit, published_only, after, tag), ["blog"],
+        lambda session: _validate_list(schemas.BlogSummary, crud.get_blogs(session, skip=skip, limit=limit, published_only=published_only, after=after, tag=tag)),
+    )
+    return _conditional(request, payload, _next_cursor_headers(payload.data, limit))
+
+@app.get("/api/tags", response_model=List[schemas.TagCount])
+async def get_tags(request: Request, db: DbRunner = Depends(get_db_runner)):
+    # Tags only change together with blog posts
+    return await _cached_response(
+        request, db, ("tags",), ["blog"],
+        lambda session: _validate_list(schemas.TagCount, crud.get_tag_counts(session)),
+    )
 
-    # Increment view count
-    crud.increment_blog_views(db, blog.id)
+@app.get("/api/blogs/search", response_model=List[schemas.BlogSummary])
+async def search_blogs(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=50),
+    db: DbRunner = Depends(get_db_runner)
+):
+    return await _cached_response(
+        request, db,
+        ("blog_search", q, limit), ["blog"],
+        lambda session: _validate_list(schemas.BlogSummary, crud.search_blogs(session, q, limit=limit)),
+    )
 
-    return blog
+@app.get("/api/blogs/{slug}", response_model=schemas.Blog)
+async def get_blog_by_slug(slug: str, db: DbRunner = Depends(get_db_runner)):
+    def load(session: Session):
+        blog = crud.get_blog_by_slug(session, slug)
+        if not blog:
+            # Raising keeps unknown slugs out of the cache
+            raise HTTPException(status_code=404, detail="Blog post not found")
+        # Views this process records later are added on top of this base
+        base_views = blog.views + blog_view_counter.pending(blog.id) - blog_view_counter.total(blog.id)
+        # Everything but the view count is serialized once; the count changes
+        # on every read and is appended to the cached bytes per request
+        data = schemas.Blog.model_validate(blog).model_dump(mode="json")
+        del data["views"]
+        return blog.id, to_json_bytes(data)[:-1] + b',"views":', base_views
+
+    # Served from the cache on a hit, so a page view usually costs no query;
+    # the view itself is counted in memory and written on the next flush
+    blog_id, body_prefix, base_views = await response_cache.aget_or_set(("blog", slug), ["blog"], lambda: db.run(load))
+    blog_view_counter.record(blog_id)
+    views = base_views + blog_view_counter.total(blog_id)
+    return Response(content=body_prefix + b"%d}" % views, media_type="application/json")
 
 # Admin Blog Routes
-@app.get("/api/admin/blogs", response_model=List[schemas.Blog])
+@app.get("/api/admin/blogs", response_model=List[schemas.BlogSummary])
 def get_all_blogs_admin(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    after: Optional[str] = None,
     db: Session = Depends(get_db),
     current_admin: str = Depends(get_current_admin)
 ):
-    return crud.get_blogs(db, skip=skip, limit=limit, published_only=False)
+    blogs = crud.get_blogs(db, skip=skip, limit=limit, published_only=False, after=after)
+    _set_next_cursor(response, blogs, limit)
+    return blogs
+
+@app.get("/api/admin/blogs/{blog_id}", response_model=schemas.Blog)
+def get_blog_admin(
+    blog_id: int,
+    db: Session = Depends(get_db),
+    current_admin: str = Depends(get_current_admin)
+):
+    blog = crud.get_blog_by_id(db, blog_id)
+    if not blog:
+        raise HTTPException(status_code=404, detail="Blog not found")
+    return blog
 
 @app.post("/api/admin/blogs", response_model=schemas.Blog, status_code=status.HTTP_201_CREATED)
 def create_blog_admin(
@@ -0,0 +1,163 @@
+import bisect
+import os
+import threading
+import time
+from dotenv import load_dotenv
+
+from sql_profiler import current_profile
+
+load_dotenv()
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# Prometheus' default latency buckets, in seconds
+LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+class _RouteStats:
+    __slots__ = ("buckets", "latency_sum", "statuses", "db_queries", "db_seconds")
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.statuses = {}
+        self.db_queries = 0
+        self.db_seconds = 0.0
+
+
+class Metrics:
+    """
+    Request metrics for the Prometheus text format, kept in plain counters.
+
+    Recording a request costs one lock and a handful of dict updates, so the
+    middleware can stay on in production. Routes are labelled by their path
+    template (`/api/blogs/{slug}`), never the raw path, to keep the number of
+    series bounded. Like the response cache, the numbers are per worker
+    process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes = {}  # (method, route) -> _RouteStats
+        self._rate_limited = {}  # route -> count
+        self._in_flight = 0
+
+    def request_started(self):
+        with self._lock:
+            self._in_flight += 1
+
+    def request_finished(self, method: str, route: str, status: int, seconds: float, profile):
+        # One lock for both the in-flight gauge and the route's counters
+        with self._lock:
+            self._in_flight -= 1
+            stats = self._routes.get((method, route))
+            if stats is None:
+                stats = self._routes[(method, route)] = _RouteStats()
+            stats.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            stats.latency_sum += seconds
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            if profile is not None:
+                stats.db_queries += profile.count
+                stats.db_seconds += profile.seconds
+
+    def rate_limited(self, route: str):
+        with self._lock:
+            self._rate_limited[route] = self._rate_limited.get(route, 0) + 1
+
+    def render(self) -> str:
+        with self._lock:
+            routes = sorted(self._routes.items())
+            rate_limited = sorted(self._rate_limited.items())
+            in_flight = self._in_flight
+
+        lines = [
+            "# HELP http_requests_total Requests served, by route and status code.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route), stats in routes:
+            for status, count in sorted(stats.statuses.items()):
+                lines.append(f'http_requests_total{{method="{method}",route="{route}",status="{status}"}} {count}')
+
+        lines += [
+            "# HELP http_request_duration_seconds Request latency, by route.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route), stats in routes:
+            labels = f'method="{method}",route="{route}"'
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, stats.buckets):
+                cumulative += count
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            total = cumulative + stats.buckets[-1]
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {total}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {stats.latency_sum:.6f}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {total}")
+
+        lines += [
+            "# HELP http_request_db_queries_total SQL statements executed while serving requests, by route.",
+            "# TYPE http_request_db_queries_total counter",
+        ]
+        for (method, route), stats in routes:
+            lines.append(f'http_request_db_queries_total{{method="{method}",route="{route}"}} {stats.db_queries}')
+
+        lines += [
+            "# HELP http_request_db_seconds_total Time spent in SQL statements while serving requests, by route.",
+            "# TYPE http_request_db_seconds_total counter",
+        ]
+        for (method, route), stats in routes:
+            lines.append(f'http_request_db_seconds_total{{method="{method}",route="{route}"}} {stats.db_seconds:.6f}')
+
+        lines += [
+            "# HELP http_requests_in_flight Requests currently being served.",
+            "# TYPE http_requests_in_flight gauge",
+            f"http_requests_in_flight {in_flight}",
+            "# HELP http_rate_limited_total Requests rejected by the rate limiter, by route.",
+            "# TYPE http_rate_limited_total counter",
+        ]
+        for route, count in rate_limited:
+            lines.append(f'http_rate_limited_total{{route="{route}"}} {count}')
+
+        return "\n".join(lines) + "\n"
+
+
+def route_label(scope) -> str:
+    # Set by the router once a route matched; unmatched paths share one label
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware: no extra task or body buffering per request. SQL
+    statements are read from the request's QueryProfile, so it has to sit
+    inside SqlProfilerMiddleware.
+    """
+
+    def __init__(self, app, metrics, skip_paths=("/metrics",)):
+        self.app = app
+        self.metrics = metrics
+        self.skip_paths = skip_paths
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self.metrics.request_started()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.metrics.request_finished(scope["method"], route_label(scope), status, elapsed, current_profile())
+
+
+metrics = Metrics()
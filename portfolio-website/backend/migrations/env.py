@@ -0,0 +1,56 @@
+from logging.config import fileConfig
+
+from alembic import context
+
+import models
+from database import engine
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = models.Base.metadata
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    # The blog search index is managed by raw DDL (models.BLOG_SEARCH_DDL),
+    # so autogenerate must not try to drop it
+    if type_ == "table" and name.startswith("blog_fts"):
+        return False
+    if type_ == "column" and name == "search_vector":
+        return False
+    if type_ == "index" and name == "ix_blog_search_vector":
+        return False
+    return True
+
+
+def run_migrations_offline():
+    """Emit SQL to stdout instead of running it (alembic upgrade --sql)"""
+    context.configure(
+        url=engine.url.render_as_string(hide_password=False),
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    with engine.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
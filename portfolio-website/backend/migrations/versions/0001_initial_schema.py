@@ -0,0 +1,142 @@
+"""Initial schema
+
+Matches the tables that Base.metadata.create_all produced before migrations
+were introduced. Tables that already exist are left alone, so databases
+bootstrapped by create_all can run `alembic upgrade head` directly.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _timestamps(with_updated_at=True):
+    columns = [sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now())]
+    if with_updated_at:
+        columns.append(sa.Column("updated_at", sa.DateTime(timezone=True)))
+    return columns
+
+
+def _create_table(existing, name, *columns):
+    if name in existing:
+        return
+    op.create_table(name, sa.Column("id", sa.Integer(), primary_key=True), *columns)
+    op.create_index(f"ix_{name}_id", name, ["id"])
+
+
+def upgrade():
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    _create_table(
+        existing, "about",
+        sa.Column("title", sa.String(200), nullable=False),
+        sa.Column("subtitle", sa.String(500)),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("profile_image", sa.String(500)),
+        sa.Column("resume_url", sa.String(500)),
+        sa.Column("email", sa.String(100)),
+        sa.Column("phone", sa.String(50)),
+        sa.Column("location", sa.String(200)),
+        *_timestamps(),
+    )
+    _create_table(
+        existing, "stack",
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("category", sa.String(100)),
+        sa.Column("icon", sa.String(500)),
+        sa.Column("proficiency", sa.Integer()),
+        sa.Column("description", sa.Text()),
+        sa.Column("order_index", sa.Integer()),
+        *_timestamps(),
+    )
+    _create_table(
+        existing, "projects",
+        sa.Column("title", sa.String(200), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("short_description", sa.String(500)),
+        sa.Column("image", sa.String(500)),
+        sa.Column("technologies", sa.Text()),
+        sa.Column("github_url", sa.String(500)),
+        sa.Column("live_url", sa.String(500)),
+        sa.Column("featured", sa.Boolean()),
+        sa.Column("order_index", sa.Integer()),
+        *_timestamps(),
+    )
+    _create_table(
+        existing, "experience",
+        sa.Column("company", sa.String(200), nullable=False),
+        sa.Column("position", sa.String(200), nullable=False),
+        sa.Column("description", sa.Text()),
+        sa.Column("start_date", sa.String(50)),
+        sa.Column("end_date", sa.String(50)),
+        sa.Column("location", sa.String(200)),
+        sa.Column("is_current", sa.Boolean()),
+        sa.Column("order_index", sa.Integer()),
+        *_timestamps(),
+    )
+    _create_table(
+        existing, "education",
+        sa.Column("institution", sa.String(200), nullable=False),
+        sa.Column("degree", sa.String(200), nullable=False),
+        sa.Column("field", sa.String(200)),
+        sa.Column("description", sa.Text()),
+        sa.Column("start_date", sa.String(50)),
+        sa.Column("end_date", sa.String(50)),
+        sa.Column("grade", sa.String(50)),
+        sa.Column("order_index", sa.Integer()),
+        *_timestamps(),
+    )
+    _create_table(
+        existing, "contact",
+        sa.Column("name", sa.String(200), nullable=False),
+        sa.Column("email", sa.String(100), nullable=False),
+        sa.Column("subject", sa.String(300)),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("is_read", sa.Boolean()),
+        *_timestamps(with_updated_at=False),
+    )
+    _create_table(
+        existing, "social_links",
+        sa.Column("platform", sa.String(50), nullable=False),
+        sa.Column("url", sa.String(500), nullable=False),
+        sa.Column("icon", sa.String(500)),
+        sa.Column("order_index", sa.Integer()),
+        *_timestamps(),
+    )
+    _create_table(
+        existing, "admin",
+        sa.Column("username", sa.String(100), nullable=False, unique=True),
+        sa.Column("hashed_password", sa.String(500), nullable=False),
+        sa.Column("email", sa.String(100)),
+        sa.Column("is_active", sa.Boolean()),
+        *_timestamps(with_updated_at=False),
+    )
+    _create_table(
+        existing, "blog",
+        sa.Column("title", sa.String(300), nullable=False),
+        sa.Column("slug", sa.String(350), nullable=False),
+        sa.Column("excerpt", sa.String(500)),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("featured_image", sa.String(500)),
+        sa.Column("published", sa.Boolean()),
+        sa.Column("tags", sa.String(500)),
+        sa.Column("author", sa.String(100)),
+        sa.Column("views", sa.Integer()),
+        *_timestamps(),
+        sa.Column("published_at", sa.DateTime(timezone=True)),
+    )
+    if "blog" not in existing:
+        op.create_index("ix_blog_slug", "blog", ["slug"], unique=True)
+
+
+def downgrade():
+    for name in ["blog", "admin", "social_links", "contact", "education", "experience", "projects", "stack", "about"]:
+        op.drop_table(name)
@@ -0,0 +1,42 @@
+"""Indexes for the queries in crud.py
+
+One index per access pattern: newest-first blog and contact listings
+(keyset pagination on created_at, id), featured projects, the unread
+contact filter, and order_index on every manually ordered section.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_blog_published_created_at", "blog", ["published", sa.text("created_at DESC"), sa.text("id DESC")]),
+    ("ix_blog_created_at", "blog", [sa.text("created_at DESC"), sa.text("id DESC")]),
+    ("ix_projects_featured_order_index", "projects", ["featured", "order_index"]),
+    ("ix_projects_order_index", "projects", ["order_index"]),
+    ("ix_contact_created_at", "contact", [sa.text("created_at DESC"), sa.text("id DESC")]),
+    ("ix_contact_is_read", "contact", ["is_read"]),
+    ("ix_stack_order_index", "stack", ["order_index"]),
+    ("ix_education_order_index", "education", ["order_index"]),
+    ("ix_social_links_order_index", "social_links", ["order_index"]),
+    ("ix_experience_order_index_start_date", "experience", ["order_index", sa.text("start_date DESC")]),
+]
+
+
+def upgrade():
+    # IF NOT EXISTS: create_all may already have built them on a fresh database
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,84 @@
+"""Full-text search index for blog posts
+
+PostgreSQL gets a generated tsvector column with a GIN index; SQLite gets an
+FTS5 table kept in sync by triggers and filled from the existing posts.
+Everything is created IF NOT EXISTS, since create_all builds the same objects
+on fresh databases (see models.BLOG_SEARCH_DDL).
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+POSTGRESQL_UPGRADE = [
+    """
+    ALTER TABLE blog ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(tags, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(excerpt, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(content, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_blog_search_vector ON blog USING GIN (search_vector)",
+]
+
+SQLITE_UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS blog_fts USING fts5(
+        title, tags, excerpt, content,
+        content='blog', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS blog_fts_insert AFTER INSERT ON blog BEGIN
+        INSERT INTO blog_fts(rowid, title, tags, excerpt, content)
+        VALUES (new.id, new.title, new.tags, new.excerpt, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS blog_fts_delete AFTER DELETE ON blog BEGIN
+        INSERT INTO blog_fts(blog_fts, rowid, title, tags, excerpt, content)
+        VALUES ('delete', old.id, old.title, old.tags, old.excerpt, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS blog_fts_update AFTER UPDATE OF title, tags, excerpt, content ON blog BEGIN
+        INSERT INTO blog_fts(blog_fts, rowid, title, tags, excerpt, content)
+        VALUES ('delete', old.id, old.title, old.tags, old.excerpt, old.content);
+        INSERT INTO blog_fts(rowid, title, tags, excerpt, content)
+        VALUES (new.id, new.title, new.tags, new.excerpt, new.content);
+    END
+    """,
+    # Index the posts that existed before this migration
+    "INSERT INTO blog_fts(blog_fts) VALUES ('rebuild')",
+]
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        statements = POSTGRESQL_UPGRADE
+    elif dialect == "sqlite":
+        statements = SQLITE_UPGRADE
+    else:
+        return
+    for statement in statements:
+        op.execute(statement)
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_blog_search_vector")
+        op.execute("ALTER TABLE blog DROP COLUMN IF EXISTS search_vector")
+    elif dialect == "sqlite":
+        for trigger in ["blog_fts_insert", "blog_fts_delete", "blog_fts_update"]:
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS blog_fts")
@@ -0,0 +1,70 @@
+"""Normalized blog tags
+
+Adds `tags` and the `blog_tags` association table, then fills them from the
+comma-separated blog.tags column, which stays as the API-facing copy.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def _parse_tags(tags):
+    names = []
+    for name in (tags or "").split(","):
+        name = name.strip().lower()[:100]
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def upgrade():
+    bind = op.get_bind()
+    existing = set(sa.inspect(bind).get_table_names())
+
+    if "tags" not in existing:
+        op.create_table(
+            "tags",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(100), nullable=False, unique=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+        op.create_index("ix_tags_id", "tags", ["id"])
+    if "blog_tags" not in existing:
+        op.create_table(
+            "blog_tags",
+            sa.Column("blog_id", sa.Integer(), sa.ForeignKey("blog.id", ondelete="CASCADE"), primary_key=True),
+            sa.Column("tag_id", sa.Integer(), sa.ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+        )
+        op.create_index("ix_blog_tags_tag_id", "blog_tags", ["tag_id", "blog_id"])
+
+    # Backfill from the existing comma-separated column
+    tags = sa.table("tags", sa.column("id", sa.Integer), sa.column("name", sa.String))
+    blog_tags = sa.table("blog_tags", sa.column("blog_id", sa.Integer), sa.column("tag_id", sa.Integer))
+    tag_ids = dict(bind.execute(sa.select(tags.c.name, tags.c.id)).fetchall())
+    linked = set(bind.execute(sa.select(blog_tags.c.blog_id, blog_tags.c.tag_id)).fetchall())
+
+    rows = []
+    for blog_id, blog_tag_string in bind.execute(sa.text("SELECT id, tags FROM blog")).fetchall():
+        for name in _parse_tags(blog_tag_string):
+            if name not in tag_ids:
+                bind.execute(tags.insert().values(name=name))
+                tag_ids[name] = bind.execute(sa.select(tags.c.id).where(tags.c.name == name)).scalar_one()
+            if (blog_id, tag_ids[name]) not in linked:
+                linked.add((blog_id, tag_ids[name]))
+                rows.append({"blog_id": blog_id, "tag_id": tag_ids[name]})
+    if rows:
+        op.bulk_insert(blog_tags, rows)
+
+
+def downgrade():
+    op.drop_table("blog_tags")
+    op.drop_table("tags")
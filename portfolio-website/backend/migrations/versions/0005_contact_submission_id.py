@@ -0,0 +1,32 @@
+"""Contact submission ids
+
+Adds contact.submission_id, set by the contact write-behind queue. The
+unique index lets a submission replayed from the queue's log after a crash
+be recognised and skipped instead of inserted twice.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    columns = {column["name"] for column in sa.inspect(bind).get_columns("contact")}
+    if "submission_id" not in columns:
+        op.add_column("contact", sa.Column("submission_id", sa.String(32)))
+    op.create_index("ix_contact_submission_id", "contact", ["submission_id"], unique=True, if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index("ix_contact_submission_id", table_name="contact")
+    with op.batch_alter_table("contact") as batch_op:
+        batch_op.drop_column("submission_id")
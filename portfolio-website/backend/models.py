@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Index, ForeignKey, Table, DDL, event
 from sqlalchemy.sql import func
 from database import Base
 
@@ -30,6 +30,10 @@ class Stack(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_stack_order_index", order_index),
+    )
+
 class Project(Base):
     __tablename__ = "projects"
     
@@ -46,6 +50,11 @@ class Project(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_projects_featured_order_index", featured, order_index),
+        Index("ix_projects_order_index", order_index),
+    )
+
 class Experience(Base):
     __tablename__ = "experience"
     
@@ -61,6 +70,10 @@ class Experience(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_experience_order_index_start_date", order_index, start_date.desc()),
+    )
+
 class Education(Base):
     __tablename__ = "education"
     
@@ -76,6 +89,10 @@ class Education(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_education_order_index", order_index),
+    )
+
 class Contact(Base):
     __tablename__ = "contact"
     
@@ -86,6 +103,14 @@ class Contact(Base):
     message = Column(Text, nullable=False)
     is_read = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Set by the contact queue, so a replayed submission is inserted once
+    submission_id = Column(String(32))
+
+    __table_args__ = (
+        Index("ix_contact_created_at", created_at.desc(), id.desc()),
+        Index("ix_contact_is_read", is_read),
+        Index("ix_contact_submission_id", submission_id, unique=True),
+    )
 
 class SocialLink(Base):
     __tablename__ = "social_links"
@@ -98,6 +123,10 @@ class SocialLink(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_social_links_order_index", order_index),
+    )
+
 class Admin(Base):
     __tablename__ = "admin"
 
@@ -124,3 +153,77 @@ class Blog(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     published_at = Column(DateTime(timezone=True))
+
+    # Keyset pagination walks (created_at, id) newest first
+    __table_args__ = (
+        Index("ix_blog_published_created_at", published, created_at.desc(), id.desc()),
+        Index("ix_blog_created_at", created_at.desc(), id.desc()),
+    )
+
+
+class Tag(Base):
+    __tablename__ = "tags"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), unique=True, nullable=False)  # lowercased
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+# Normalized copy of Blog.tags, rewritten by crud on every blog create/update.
+# The primary key serves blog -> tags; ix_blog_tags_tag_id serves tag -> blogs.
+blog_tags = Table(
+    "blog_tags",
+    Base.metadata,
+    Column("blog_id", Integer, ForeignKey("blog.id", ondelete="CASCADE"), primary_key=True),
+    Column("tag_id", Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_blog_tags_tag_id", "tag_id", "blog_id"),
+)
+
+# Full-text search over published posts. The database keeps the index in step
+# with every write to `blog`, so crud.create_blog/update_blog/delete_blog (and
+# any bulk path) never have to touch it. PostgreSQL uses a generated tsvector
+# column with a GIN index; SQLite (local runs) uses an FTS5 table with triggers.
+BLOG_SEARCH_DDL = {
+    "postgresql": [
+        """
+        ALTER TABLE blog ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(tags, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(excerpt, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(content, '')), 'C')
+        ) STORED
+        """,
+        "CREATE INDEX ix_blog_search_vector ON blog USING GIN (search_vector)",
+    ],
+    "sqlite": [
+        """
+        CREATE VIRTUAL TABLE blog_fts USING fts5(
+            title, tags, excerpt, content,
+            content='blog', content_rowid='id', tokenize='porter unicode61'
+        )
+        """,
+        """
+        CREATE TRIGGER blog_fts_insert AFTER INSERT ON blog BEGIN
+            INSERT INTO blog_fts(rowid, title, tags, excerpt, content)
+            VALUES (new.id, new.title, new.tags, new.excerpt, new.content);
+        END
+        """,
+        """
+        CREATE TRIGGER blog_fts_delete AFTER DELETE ON blog BEGIN
+            INSERT INTO blog_fts(blog_fts, rowid, title, tags, excerpt, content)
+            VALUES ('delete', old.id, old.title, old.tags, old.excerpt, old.content);
+        END
+        """,
+        """
+        CREATE TRIGGER blog_fts_update AFTER UPDATE OF title, tags, excerpt, content ON blog BEGIN
+            INSERT INTO blog_fts(blog_fts, rowid, title, tags, excerpt, content)
+            VALUES ('delete', old.id, old.title, old.tags, old.excerpt, old.content);
+            INSERT INTO blog_fts(rowid, title, tags, excerpt, content)
+            VALUES (new.id, new.title, new.tags, new.excerpt, new.content);
+        END
+        """,
+    ],
+}
+
+for _dialect, _statements in BLOG_SEARCH_DDL.items():
+    for _statement in _statements:
+        event.listen(Blog.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect))
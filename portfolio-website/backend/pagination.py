@@ -0,0 +1,60 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Optional, Tuple
+from sqlalchemy import String, and_, literal, or_, type_coerce
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor(cursor)
+
+
+def next_cursor(rows, limit: int) -> Optional[str]:
+    # A short page means there is nothing after it
+    if len(rows) < limit or not rows:
+        return None
+    last = rows[-1]
+    return encode_cursor(last.created_at, last.id)
+
+
+def _created_at_bound(model, value: datetime, dialect_name: str):
+    # SQLite stores timestamps as text, and server defaults omit the
+    # fractional seconds that a bound datetime would include. Compare the
+    # column as text against the same format so its index stays usable.
+    if dialect_name == "sqlite":
+        text = value.strftime("%Y-%m-%d %H:%M:%S")
+        if value.microsecond:
+            text += ".%06d" % value.microsecond
+        return type_coerce(model.created_at, String), literal(text, String)
+    return model.created_at, value
+
+
+def newest_first(query, model, cursor: Optional[str] = None):
+    """
+    Order `query` by (created_at, id) descending and, when a cursor is given,
+    keep only rows after it. Unlike OFFSET, the cost of a page does not grow
+    with how deep it is.
+    """
+    if cursor:
+        after_created_at, after_id = decode_cursor(cursor)
+        dialect_name = query.session.get_bind().dialect.name
+        created_at, after_created_at = _created_at_bound(model, after_created_at, dialect_name)
+        query = query.filter(or_(
+            created_at < after_created_at,
+            and_(created_at == after_created_at, model.id < after_id),
+        ))
+    return query.order_by(model.created_at.desc(), model.id.desc())
@@ -0,0 +1,130 @@
+import asyncio
+import multiprocessing
+import os
+import secrets
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dotenv import load_dotenv
+from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
+
+load_dotenv()
+
+PASSWORD_POOL_WORKERS = int(os.getenv("PASSWORD_POOL_WORKERS", "2"))
+PASSWORD_POOL_MAX_QUEUE = int(os.getenv("PASSWORD_POOL_MAX_QUEUE", "16"))
+
+pwd_context = CryptContext(schemes=["bcrypt_sha256", "bcrypt"], deprecated="auto")
+
+# Run inside the worker processes; kept at module level so they pickle by name
+def _verify(plain_password, hashed_password):
+    return pwd_context.verify(plain_password, hashed_password)
+
+def _hash(password):
+    return pwd_context.hash(password)
+
+
+class PasswordPoolBusy(Exception):
+    pass
+
+
+class PasswordPool:
+    """
+    Runs bcrypt hashing and verification in a small pool of worker processes.
+
+    A bcrypt check costs hundreds of milliseconds of CPU; in a worker process
+    it neither holds the GIL nor a threadpool thread of the web worker, so a
+    burst of logins cannot slow public routes down. At most `workers +
+    max_queue` checks may be in flight; beyond that `PasswordPoolBusy` is
+    raised instead of letting the backlog grow. With `workers=0` the checks
+    run in the threadpool as before.
+    """
+
+    def __init__(self, workers: int = PASSWORD_POOL_WORKERS, max_queue: int = PASSWORD_POOL_MAX_QUEUE):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = None
+        self._in_flight = 0
+        self._dummy_hash = None
+        self._dummy_lock = asyncio.Lock()
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    def start(self):
+        with self._lock:
+            if self._executor is None and self.workers > 0:
+                # spawn rather than fork: the web worker already runs threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+
+    async def prepare(self):
+        """
+        Create the dummy hash for unknown usernames ahead of the first login,
+        so that login does not pay for it and take longer than a known one.
+        """
+        try:
+            await self._get_dummy_hash()
+        except Exception as e:
+            print(f"⚠️  WARNING: Could not prepare password pool: {e}")
+
+    async def _get_dummy_hash(self):
+        # Hashed once, in the pool like any other check; concurrent first
+        # callers wait for the same hash
+        async with self._dummy_lock:
+            if self._dummy_hash is None:
+                self._dummy_hash = await self.hash(secrets.token_urlsafe(32))
+        return self._dummy_hash
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _submit(self, fn, *args):
+        with self._lock:
+            if self._in_flight >= self.workers + self.max_queue:
+                self.rejected += 1
+                raise PasswordPoolBusy()
+            self._in_flight += 1
+        try:
+            if self.workers <= 0:
+                return await run_in_threadpool(fn, *args)
+            self.start()
+            try:
+                return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+            except BrokenProcessPool:
+                # A worker died; start a fresh pool for the next call
+                self.shutdown()
+                raise
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(_verify, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(_hash, password)
+
+    async def verify_unknown(self, plain_password: str) -> bool:
+        """
+        Spend the same work as a real check for a username that does not
+        exist, so response time does not reveal which usernames are valid.
+        Always returns False.
+        """
+        await self.verify(plain_password, await self._get_dummy_hash())
+        return False
+
+    def stats(self):
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "rejected": self.rejected,
+            }
+
+
+password_pool = PasswordPool()
@@ -0,0 +1,150 @@
+import bisect
+import os
+import threading
+import time
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeout
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Upper bounds (ms) of the checkout wait histogram; the last bucket is open
+WAIT_BUCKETS_MS = [1, 5, 10, 50, 100, 500, 1000, 5000]
+
+
+class PoolMonitor:
+    """
+    Collects checkout statistics for one connection pool.
+
+    Checkout waits are timed by the instrumented pool classes below, and
+    connection lifetimes through the pool's connect/close events. Like the
+    response cache, the numbers are per worker process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._wait_counts = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._connected_at = {}  # id(connection record) -> monotonic time
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.closes = 0
+        self.pool = None
+
+    def attach(self, pool):
+        self.pool = pool
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "close", self._on_close)
+        event.listen(pool, "close_detached", self._on_close_detached)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+            self._connected_at[id(connection_record)] = time.monotonic()
+
+    def _on_close(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.closes += 1
+            self._connected_at.pop(id(connection_record), None)
+
+    def _on_close_detached(self, dbapi_connection):
+        with self._lock:
+            self.closes += 1
+
+    def record_wait(self, seconds: float, timed_out: bool = False):
+        wait_ms = seconds * 1000
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self._wait_counts[bisect.bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+            self._wait_total += wait_ms
+            self._wait_max = max(self._wait_max, wait_ms)
+
+    def stats(self):
+        now = time.monotonic()
+        with self._lock:
+            ages = [now - connected_at for connected_at in self._connected_at.values()]
+            waits = self.checkouts + self.timeouts
+            histogram = {f"le_{bound}ms": count for bound, count in zip(WAIT_BUCKETS_MS, self._wait_counts)}
+            histogram[f"gt_{WAIT_BUCKETS_MS[-1]}ms"] = self._wait_counts[-1]
+            stats = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "closes": self.closes,
+                "wait_ms": {
+                    "mean": round(self._wait_total / waits, 3) if waits else 0.0,
+                    "max": round(self._wait_max, 3),
+                    "histogram": histogram,
+                },
+                "connection_age_seconds": {
+                    "open": len(ages),
+                    "oldest": round(max(ages), 1) if ages else 0.0,
+                    "mean": round(sum(ages) / len(ages), 1) if ages else 0.0,
+                },
+            }
+        if isinstance(self.pool, QueuePool):
+            stats.update({
+                "pool_size": self.pool.size(),
+                "checked_out": self.pool.checkedout(),
+                "checked_in": self.pool.checkedin(),
+                "overflow": max(self.pool.overflow(), 0),
+                "max_overflow": self.pool._max_overflow,
+                "timeout_seconds": self.pool.timeout(),
+            })
+        stats["pool_class"] = type(self.pool).__name__
+        return stats
+
+
+class _TimedCheckout:
+    # Times QueuePool._do_get, which is where a checkout blocks once every
+    # pooled and overflow connection is in use
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeout:
+            self.monitor.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        self.monitor.record_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        # dispose() rebuilds the pool; event listeners carry over on their
+        # own, the monitor has to be handed on
+        pool = super().recreate()
+        pool.monitor = self.monitor
+        self.monitor.pool = pool
+        return pool
+
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_options(url: str, async_driver: bool = False):
+    """create_engine keyword arguments for the pool, read from the environment"""
+    # In-memory SQLite keeps one connection per thread and takes no pool sizing
+    if url.startswith("sqlite") and (":memory:" in url or url.rstrip("/") in ("sqlite:", "sqlite+aiosqlite:")):
+        return {}
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if async_driver else InstrumentedQueuePool,
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+    }
+
+
+def monitor_engine(engine) -> PoolMonitor:
+    monitor = PoolMonitor()
+    monitor.attach(engine.pool)
+    engine.pool.monitor = monitor
+    return monitor
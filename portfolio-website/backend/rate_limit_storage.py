@@ -0,0 +1,168 @@
+import os
+import sqlite3
+import threading
+import time
+from math import floor
+from urllib.parse import urlparse
+from dotenv import load_dotenv
+from limits.storage import SlidingWindowCounterSupport, Storage
+from limits.storage.base import TimestampedSlidingWindow
+
+load_dotenv()
+
+# memory:// restores per-process counters; "sliding-window-counter" smooths
+# out bursts at window boundaries
+RATE_LIMIT_STORAGE_URI = os.getenv("RATE_LIMIT_STORAGE_URI", "sqlite:///rate-limits.db")
+RATE_LIMIT_STRATEGY = os.getenv("RATE_LIMIT_STRATEGY", "fixed-window")
+
+# Expired counters are deleted on every Nth write rather than by a timer
+PURGE_EVERY = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limits (
+    key TEXT PRIMARY KEY,
+    count INTEGER NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+# Start a new window when the stored one has expired, else add to it
+_INCR = """
+INSERT INTO rate_limits (key, count, expires_at) VALUES (:key, :amount, :expires_at)
+ON CONFLICT (key) DO UPDATE SET
+    count = CASE WHEN expires_at <= :now THEN :amount ELSE count + :amount END,
+    expires_at = CASE WHEN expires_at <= :now THEN :expires_at ELSE expires_at END
+RETURNING count
+"""
+
+
+class SQLiteStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    """
+    Rate limit counters in a local SQLite file, shared by every worker
+    process on the host.
+
+    slowapi's default `memory://` storage keeps counters per process, so N
+    uvicorn workers allow N times the configured limit. Here all workers
+    upsert the same row: a hit is one `INSERT ... ON CONFLICT DO UPDATE ...
+    RETURNING` in autocommit mode, which SQLite runs atomically across
+    processes. The file uses WAL with `synchronous=OFF`, so a hit never
+    waits for the disk; a power loss can at worst forget recent counts.
+    `benchmarks/rate_limit_storage.py` measures the cost per check.
+
+    Registered for `sqlite:///relative/path.db` and `sqlite:////absolute/path.db`
+    URIs (needs SQLite 3.35+ for RETURNING).
+    """
+
+    STORAGE_SCHEME = ["sqlite"]
+
+    def __init__(self, uri: str, wrap_exceptions: bool = False, timeout: float = 5.0, **options):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        # sqlite:///a.db -> a.db, sqlite:////tmp/a.db -> /tmp/a.db
+        self.path = urlparse(uri).path[1:] or ":memory:"
+        self.timeout = float(timeout)
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+        self._writes = 0
+
+    @property
+    def base_exceptions(self):
+        return sqlite3.Error
+
+    def _connect(self):
+        # Opened on first use and again after a fork, never at import time;
+        # the caller holds self._lock
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=OFF")
+            connection.execute(_SCHEMA)
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def _incr(self, connection, key: str, expiry: float, amount: int, now: float) -> int:
+        count = connection.execute(
+            _INCR, {"key": key, "amount": amount, "expires_at": now + expiry, "now": now}
+        ).fetchone()[0]
+        self._writes += 1
+        if self._writes % PURGE_EVERY == 0:
+            connection.execute("DELETE FROM rate_limits WHERE expires_at <= ?", (now,))
+        return count
+
+    def _get(self, connection, key: str, now: float) -> int:
+        row = connection.execute(
+            "SELECT count FROM rate_limits WHERE key = ? AND expires_at > ?", (key, now)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        with self._lock:
+            return self._incr(self._connect(), key, expiry, amount, time.time())
+
+    def get(self, key: str) -> int:
+        with self._lock:
+            return self._get(self._connect(), key, time.time())
+
+    def get_expiry(self, key: str) -> float:
+        now = time.time()
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT expires_at FROM rate_limits WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+        return row[0] if row else now
+
+    def check(self) -> bool:
+        try:
+            with self._lock:
+                self._connect().execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self):
+        with self._lock:
+            return self._connect().execute("DELETE FROM rate_limits").rowcount
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM rate_limits WHERE key = ?", (key,))
+
+    # --- sliding window counter strategy ---
+
+    def _sliding_window_info(self, connection, key: str, expiry: int, now: float):
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        previous_count = self._get(connection, previous_key, now)
+        current_count = self._get(connection, current_key, now)
+        previous_ttl = (1 - (((now - expiry) / expiry) % 1)) * expiry if previous_count else 0.0
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return previous_count, previous_ttl, current_count, current_ttl
+
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        if amount > limit:
+            return False
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            # Read and increment in one write transaction, so two workers
+            # cannot both take the last slot
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                previous_count, previous_ttl, current_count, _ = self._sliding_window_info(connection, key, expiry, now)
+                if floor(previous_count * previous_ttl / expiry + current_count) + amount > limit:
+                    return False
+                _, current_key = self.sliding_window_keys(key, expiry, now)
+                # Kept for two windows: it becomes the previous window next
+                self._incr(connection, current_key, 2 * expiry, amount, now)
+                return True
+            finally:
+                connection.execute("COMMIT")
+
+    def get_sliding_window(self, key: str, expiry: int):
+        with self._lock:
+            return self._sliding_window_info(self._connect(), key, expiry, time.time())
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, time.time())
+        with self._lock:
+            self._connect().execute("DELETE FROM rate_limits WHERE key IN (?, ?)", (previous_key, current_key))
@@ -0,0 +1,69 @@
+from typing import Any, Dict, Optional
+from sqlalchemy import delete, insert, update
+from sqlalchemy.orm import Session
+
+from cache import response_cache
+
+
+class Repository:
+    """
+    Single-statement writes for one model.
+
+    create, update and delete each send one INSERT / UPDATE / DELETE with
+    RETURNING and commit, instead of SELECT + change + commit + refresh. The
+    returned row is detached from the session before the commit, so reading
+    its attributes afterwards does not reload it. Writes invalidate
+    `cache_table` in the response cache when it is set.
+    """
+
+    def __init__(self, model, cache_table: Optional[str] = None):
+        self.model = model
+        self.cache_table = cache_table
+
+    def get(self, db: Session, row_id: int):
+        return db.get(self.model, row_id)
+
+    def create(self, db: Session, values: Dict[str, Any]):
+        row = db.scalars(insert(self.model).values(**values).returning(self.model)).one()
+        return self.commit(db, row)
+
+    def update(self, db: Session, row_id: int, values: Dict[str, Any]):
+        """Returns the updated row, or None if there is no row with that id"""
+        if not values:
+            return self.get(db, row_id)
+        row = db.scalars(
+            update(self.model)
+            .where(self.model.id == row_id)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(synchronize_session="fetch")
+        ).one_or_none()
+        if row is None:
+            db.rollback()
+            return None
+        return self.commit(db, row)
+
+    def delete(self, db: Session, row_id: int) -> bool:
+        deleted = db.scalar(
+            delete(self.model)
+            .where(self.model.id == row_id)
+            .returning(self.model.id)
+            .execution_options(synchronize_session=False)
+        )
+        if deleted is None:
+            db.rollback()
+            return False
+        db.commit()
+        self._invalidate()
+        return True
+
+    def commit(self, db: Session, row):
+        # Also used by crud functions that write more than the row itself
+        db.expunge(row)
+        db.commit()
+        self._invalidate()
+        return row
+
+    def _invalidate(self):
+        if self.cache_table:
+            response_cache.invalidate(self.cache_table)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field, validator, HttpUrl
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 import re
 
@@ -165,6 +165,10 @@ class ContactBase(BaseModel):
 class ContactCreate(ContactBase):
     pass
 
+class ContactAccepted(BaseModel):
+    reference: str
+    status: str = "queued"
+
 class Contact(ContactBase):
     id: int
     is_read: bool
@@ -197,6 +201,45 @@ class SocialLink(SocialLinkBase):
     class Config:
         from_attributes = True
 
+# Tag Schemas
+class TagCount(BaseModel):
+    name: str
+    count: int
+
+    class Config:
+        from_attributes = True
+
+# Portfolio Schemas
+class Portfolio(BaseModel):
+    about: Optional[About] = None
+    stack: List[Stack] = []
+    projects: List[Project] = []
+    experience: List[Experience] = []
+    education: List[Education] = []
+    social_links: List[SocialLink] = []
+
+# Bulk Schemas
+# Items stay plain dicts here and are validated one by one against the
+# section's Create/Update schema, so every invalid item can be reported
+class BulkRequest(BaseModel):
+    create: List[Dict[str, Any]] = Field(default_factory=list, max_length=500)
+    update: List[Dict[str, Any]] = Field(default_factory=list, max_length=500)  # each with an "id"
+    delete: List[int] = Field(default_factory=list, max_length=500)
+
+class BulkResult(BaseModel):
+    created: List[int] = []
+    updated: List[int] = []
+    deleted: List[int] = []
+
+class ReorderRequest(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=1000)  # in display order
+
+    @validator('ids')
+    def validate_unique(cls, v):
+        if len(set(v)) != len(v):
+            raise ValueError('Each id may appear only once')
+        return v
+
 # Admin Schemas
 class AdminLogin(BaseModel):
     username: str
@@ -277,3 +320,21 @@ class Blog(BlogBase):
 
     class Config:
         from_attributes = True
+
+# List pages never render the post body, so summaries leave out `content`
+class BlogSummary(BaseModel):
+    id: int
+    title: str
+    slug: str
+    excerpt: Optional[str] = None
+    featured_image: Optional[str] = None
+    published: bool = False
+    tags: Optional[str] = None
+    author: Optional[str] = None
+    views: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    published_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
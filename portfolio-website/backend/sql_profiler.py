@@ -0,0 +1,120 @@
+import contextvars
+import os
+import re
+import time
+from dotenv import load_dotenv
+from sqlalchemy import event
+
+load_dotenv()
+
+# On by default outside production: statement normalization, the warnings
+# below and the Server-Timing header. Counting alone always runs, since
+# /metrics reports it.
+SQL_PROFILING = os.getenv("SQL_PROFILING", str(os.getenv("ENVIRONMENT") != "production")).lower() == "true"
+SQL_MAX_QUERIES_PER_REQUEST = int(os.getenv("SQL_MAX_QUERIES_PER_REQUEST", "20"))
+SQL_REPEATED_QUERY_THRESHOLD = int(os.getenv("SQL_REPEATED_QUERY_THRESHOLD", "5"))
+SQL_SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", "100"))
+
+_WHITESPACE = re.compile(r"\s+")
+_IN_LIST = re.compile(r"\bIN \([^()]*\)", re.IGNORECASE)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+
+def normalize_sql(statement: str) -> str:
+    """Collapse a statement to its shape so repeats with other values group together"""
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    statement = _STRING.sub("?", statement)
+    statement = _NUMBER.sub("?", statement)
+    return _IN_LIST.sub("IN (...)", statement)
+
+
+class QueryProfile:
+    """SQL statements run while serving one request"""
+
+    __slots__ = ("label", "count", "seconds", "statements")
+
+    def __init__(self, label: str):
+        self.label = label
+        self.count = 0
+        self.seconds = 0.0
+        self.statements = {}  # normalized SQL -> executions, only when profiling
+
+    def repeated(self, threshold: int):
+        return sorted(
+            ((count, sql) for sql, count in self.statements.items() if count >= threshold),
+            reverse=True,
+        )
+
+
+# Shared by reference, so statements run in the threadpool or through
+# AsyncSession.run_sync land in the profile of the request that started them
+_current = contextvars.ContextVar("query_profile", default=None)
+
+def current_profile():
+    return _current.get()
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _current.get() is not None:
+        context._profile_started = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current.get()
+    started = getattr(context, "_profile_started", None)
+    if profile is None or started is None:
+        return
+    elapsed = time.perf_counter() - started
+    profile.count += 1
+    profile.seconds += elapsed
+    if SQL_PROFILING:
+        normalized = normalize_sql(statement)
+        profile.statements[normalized] = profile.statements.get(normalized, 0) + 1
+        if elapsed * 1000 >= SQL_SLOW_QUERY_MS:
+            print(f"⚠️  Slow query ({elapsed * 1000:.1f} ms) in {profile.label}: {normalized}")
+
+def instrument_engine(engine):
+    """Count statements and their time against the request being served"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class SqlProfilerMiddleware:
+    """
+    Pure ASGI middleware that opens a QueryProfile for every HTTP request.
+
+    With profiling on, it adds `Server-Timing: db;dur=<ms>;desc="<n> queries"`
+    to the response and warns about requests that run more than
+    SQL_MAX_QUERIES_PER_REQUEST statements or the same statement
+    SQL_REPEATED_QUERY_THRESHOLD times (the usual N+1 pattern).
+    """
+
+    def __init__(self, app, profiling: bool = SQL_PROFILING):
+        self.app = app
+        self.profiling = profiling
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = QueryProfile(f"{scope['method']} {scope['path']}")
+        token = _current.set(profile)
+
+        async def send_wrapper(message):
+            if self.profiling and message["type"] == "http.response.start":
+                timing = f'db;dur={profile.seconds * 1000:.1f};desc="{profile.count} queries"'
+                message.setdefault("headers", []).append((b"server-timing", timing.encode()))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            if self.profiling:
+                self.report(profile)
+
+    @staticmethod
+    def report(profile: QueryProfile):
+        if profile.count > SQL_MAX_QUERIES_PER_REQUEST:
+            print(f"⚠️  {profile.label} ran {profile.count} SQL statements ({profile.seconds * 1000:.1f} ms)")
+        for count, sql in profile.repeated(SQL_REPEATED_QUERY_THRESHOLD):
+            print(f"⚠️  Possible N+1 in {profile.label}: {count} x {sql}")
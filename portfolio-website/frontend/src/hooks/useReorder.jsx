@@ -0,0 +1,30 @@
+import { useState } from 'react';
+
+// Moves an item one place up or down and saves the whole order with a single
+// reorder request. The list changes right away and is reloaded if saving fails.
+export const useReorder = (items, setItems, { save, reload, onUpdate, onError }) => {
+  const [reordering, setReordering] = useState(false);
+
+  const move = async (index, offset) => {
+    const target = index + offset;
+    if (reordering || target < 0 || target >= items.length) return;
+
+    const reordered = [...items];
+    const [moved] = reordered.splice(index, 1);
+    reordered.splice(target, 0, moved);
+    setItems(reordered);
+    setReordering(true);
+    try {
+      await save(reordered.map((item) => item.id));
+      if (onUpdate) onUpdate();
+    } catch (error) {
+      console.error('Error reordering:', error);
+      if (onError) onError(error);
+      reload();
+    } finally {
+      setReordering(false);
+    }
+  };
+
+  return { move, reordering };
+};
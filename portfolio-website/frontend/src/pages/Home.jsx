@@ -1,7 +1,7 @@
 import { useEffect, useState } from 'react';
 import { motion } from 'framer-motion';
 import { FaGithub, FaLinkedin, FaTwitter, FaEnvelope, FaPhone, FaMapMarkerAlt, FaFileDownload, FaInstagram, FaFacebook, FaPinterest, FaYoutube, FaGlobe, FaDribbble, FaBehance, FaMedium, FaStackOverflow, FaTiktok, FaWhatsapp, FaTelegram, FaDiscord, FaSlack, FaGoogleDrive } from 'react-icons/fa';
-import { getAbout, getStack, getProjects, getExperience, getEducation, getSocialLinks, submitContact } from '../services/api';
+import { getPortfolio, submitContact } from '../services/api';
 import Navbar from '../components/Navbar';
 import ProjectCarousel from '../components/ProjectCarousel';
 import ExperienceTimeline from '../components/ExperienceTimeline';
@@ -32,21 +32,15 @@ const Home = () => {
 
   const loadData = async () => {
     try {
-      const [aboutRes, stackRes, projectsRes, expRes, eduRes, socialRes] = await Promise.all([
-        getAbout().catch(() => ({ data: null })),
-        getStack().catch(() => ({ data: [] })),
-        getProjects().catch(() => ({ data: [] })),
-        getExperience().catch(() => ({ data: [] })),
-        getEducation().catch(() => ({ data: [] })),
-        getSocialLinks().catch(() => ({ data: [] })),
-      ]);
+      // Single request for every home page section
+      const { data } = await getPortfolio();
 
-      setAbout(aboutRes.data);
-      setStack(stackRes.data);
-      setProjects(projectsRes.data);
-      setExperience(expRes.data);
-      setEducation(eduRes.data);
-      setSocialLinks(socialRes.data);
+      setAbout(data.about);
+      setStack(data.stack);
+      setProjects(data.projects);
+      setExperience(data.experience);
+      setEducation(data.education);
+      setSocialLinks(data.social_links);
     } catch (error) {
       console.error('Error loading data:', error);
     }
@@ -1,5 +1,5 @@
 import { useState, useEffect } from 'react';
-import { adminGetBlogs, adminCreateBlog, adminUpdateBlog, adminDeleteBlog } from '../../../services/api';
+import { adminGetBlogs, adminGetBlog, adminCreateBlog, adminUpdateBlog, adminDeleteBlog } from '../../../services/api';
 import { FaEdit, FaTrash, FaEye, FaEyeSlash } from 'react-icons/fa';
 import Toast from '../../../components/Toast';
 import LoadingSpinner from '../../../components/LoadingSpinner';
@@ -83,19 +83,28 @@ const BlogManager = ({ onUpdate }) => {
     }
   };
 
-  const handleEdit = (item) => {
-    setEditingItem(item);
-    setFormData({
-      title: item.title || '',
-      slug: item.slug || '',
-      excerpt: item.excerpt || '',
-      content: item.content || '',
-      featured_image: item.featured_image || '',
-      published: item.published || false,
-      tags: item.tags || '',
-      author: item.author || '',
-    });
-    setShowModal(true);
+  const handleEdit = async (summary) => {
+    // The list only carries summaries; fetch the full post for its content
+    setLoading(true);
+    try {
+      const { data: item } = await adminGetBlog(summary.id);
+      setEditingItem(item);
+      setFormData({
+        title: item.title || '',
+        slug: item.slug || '',
+        excerpt: item.excerpt || '',
+        content: item.content || '',
+        featured_image: item.featured_image || '',
+        published: item.published || false,
+        tags: item.tags || '',
+        author: item.author || '',
+      });
+      setShowModal(true);
+    } catch (error) {
+      showToast('Failed to load blog', 'error');
+    } finally {
+      setLoading(false);
+    }
   };
 
   const handleDelete = async (id) => {
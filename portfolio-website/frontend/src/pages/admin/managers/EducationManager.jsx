@@ -1,6 +1,7 @@
 import { useState, useEffect } from 'react';
-import { getEducation, adminCreateEducation, adminUpdateEducation, adminDeleteEducation } from '../../../services/api';
-import { FaEdit, FaTrash } from 'react-icons/fa';
+import { getEducation, adminCreateEducation, adminUpdateEducation, adminDeleteEducation, adminReorderEducation } from '../../../services/api';
+import { FaEdit, FaTrash, FaArrowUp, FaArrowDown } from 'react-icons/fa';
+import { useReorder } from '../../../hooks/useReorder';
 
 const EducationManager = ({ onUpdate }) => {
   const [data, setData] = useState([]);
@@ -17,6 +18,13 @@ const EducationManager = ({ onUpdate }) => {
     } catch (e) {}
   };
 
+  const { move, reordering } = useReorder(data, setData, {
+    save: adminReorderEducation,
+    reload: load,
+    onUpdate,
+    onError: () => alert('Failed to reorder'),
+  });
+
   const submit = async (e) => {
     e.preventDefault();
     try {
@@ -40,13 +48,19 @@ const EducationManager = ({ onUpdate }) => {
         <button className="btn-primary" onClick={() => setShowModal(true)}>Add Education</button>
       </div>
       <div className="item-list">
-        {data.map((item) => (
+        {data.map((item, index) => (
           <div key={item.id} className="item-card">
             <div>
               <h3>{item.degree}</h3>
               <p>{item.institution}</p>
             </div>
             <div className="item-actions">
+              <button className="btn-secondary" onClick={() => move(index, -1)} disabled={reordering || index === 0} title="Move up">
+                <FaArrowUp />
+              </button>
+              <button className="btn-secondary" onClick={() => move(index, 1)} disabled={reordering || index === data.length - 1} title="Move down">
+                <FaArrowDown />
+              </button>
               <button className="btn-secondary" onClick={() => {
                 setEditing(item);
                 setForm({
@@ -1,6 +1,7 @@
 import { useState, useEffect } from 'react';
-import { getExperience, adminCreateExperience, adminUpdateExperience, adminDeleteExperience } from '../../../services/api';
-import { FaEdit, FaTrash } from 'react-icons/fa';
+import { getExperience, adminCreateExperience, adminUpdateExperience, adminDeleteExperience, adminReorderExperience } from '../../../services/api';
+import { FaEdit, FaTrash, FaArrowUp, FaArrowDown } from 'react-icons/fa';
+import { useReorder } from '../../../hooks/useReorder';
 
 const ExperienceManager = ({ onUpdate }) => {
   const [experiences, setExperiences] = useState([]);
@@ -22,6 +23,13 @@ const ExperienceManager = ({ onUpdate }) => {
     }
   };
 
+  const { move, reordering } = useReorder(experiences, setExperiences, {
+    save: adminReorderExperience,
+    reload: loadData,
+    onUpdate,
+    onError: () => alert('Failed to reorder'),
+  });
+
   const handleSubmit = async (e) => {
     e.preventDefault();
     try {
@@ -51,13 +59,19 @@ const ExperienceManager = ({ onUpdate }) => {
         <button className="btn-primary" onClick={() => setShowModal(true)}>Add Experience</button>
       </div>
       <div className="item-list">
-        {experiences.map((item) => (
+        {experiences.map((item, index) => (
           <div key={item.id} className="item-card">
             <div>
               <h3>{item.position} at {item.company}</h3>
               <p>{item.start_date} - {item.is_current ? 'Present' : item.end_date}</p>
             </div>
             <div className="item-actions">
+              <button className="btn-secondary" onClick={() => move(index, -1)} disabled={reordering || index === 0} title="Move up">
+                <FaArrowUp />
+              </button>
+              <button className="btn-secondary" onClick={() => move(index, 1)} disabled={reordering || index === experiences.length - 1} title="Move down">
+                <FaArrowDown />
+              </button>
               <button className="btn-secondary" onClick={() => {
                 setEditingItem(item);
                 setFormData({
@@ -1,9 +1,10 @@
 import { useState, useEffect } from 'react';
-import { getProjects, adminCreateProject, adminUpdateProject, adminDeleteProject } from '../../../services/api';
-import { FaEdit, FaTrash } from 'react-icons/fa';
+import { getProjects, adminCreateProject, adminUpdateProject, adminDeleteProject, adminReorderProjects } from '../../../services/api';
+import { FaEdit, FaTrash, FaArrowUp, FaArrowDown } from 'react-icons/fa';
 import Toast from '../../../components/Toast';
 import ImagePreview from '../../../components/ImagePreview';
 import LoadingSpinner from '../../../components/LoadingSpinner';
+import { useReorder } from '../../../hooks/useReorder';
 
 const ProjectManager = ({ onUpdate }) => {
   const [projects, setProjects] = useState([]);
@@ -44,6 +45,13 @@ const ProjectManager = ({ onUpdate }) => {
     }
   };
 
+  const { move, reordering } = useReorder(projects, setProjects, {
+    save: adminReorderProjects,
+    reload: loadProjects,
+    onUpdate,
+    onError: () => showToast('Failed to reorder projects', 'error'),
+  });
+
   const handleSubmit = async (e) => {
     e.preventDefault();
     setLoading(true);
@@ -136,13 +144,19 @@ const ProjectManager = ({ onUpdate }) => {
         </div>
       ) : (
         <div className="item-list">
-          {projects.map((item) => (
+          {projects.map((item, index) => (
             <div key={item.id} className="item-card">
               <div>
                 <h3>{item.title} {item.featured && <span style={{color: 'var(--color-warning)'}}>★</span>}</h3>
                 <p>{item.short_description}</p>
               </div>
               <div className="item-actions">
+                <button className="btn-secondary" onClick={() => move(index, -1)} disabled={loading || reordering || index === 0} title="Move up">
+                  <FaArrowUp />
+                </button>
+                <button className="btn-secondary" onClick={() => move(index, 1)} disabled={loading || reordering || index === projects.length - 1} title="Move down">
+                  <FaArrowDown />
+                </button>
                 <button className="btn-secondary" onClick={() => handleEdit(item)} disabled={loading}>
                   <FaEdit />
                 </button>
@@ -1,6 +1,7 @@
 import { useState, useEffect } from 'react';
-import { getSocialLinks, adminCreateSocialLink, adminUpdateSocialLink, adminDeleteSocialLink } from '../../../services/api';
-import { FaEdit, FaTrash } from 'react-icons/fa';
+import { getSocialLinks, adminCreateSocialLink, adminUpdateSocialLink, adminDeleteSocialLink, adminReorderSocialLinks } from '../../../services/api';
+import { FaEdit, FaTrash, FaArrowUp, FaArrowDown } from 'react-icons/fa';
+import { useReorder } from '../../../hooks/useReorder';
 
 const SocialLinkManager = ({ onUpdate }) => {
   const [links, setLinks] = useState([]);
@@ -17,6 +18,13 @@ const SocialLinkManager = ({ onUpdate }) => {
     } catch (e) {}
   };
 
+  const { move, reordering } = useReorder(links, setLinks, {
+    save: adminReorderSocialLinks,
+    reload: load,
+    onUpdate,
+    onError: () => alert('Failed to reorder'),
+  });
+
   const submit = async (e) => {
     e.preventDefault();
     try {
@@ -40,10 +48,16 @@ const SocialLinkManager = ({ onUpdate }) => {
         <button className="btn-primary" onClick={() => setShowModal(true)}>Add Link</button>
       </div>
       <div className="item-list">
-        {links.map((item) => (
+        {links.map((item, index) => (
           <div key={item.id} className="item-card">
             <div><h3>{item.platform}</h3><p>{item.url}</p></div>
             <div className="item-actions">
+              <button className="btn-secondary" onClick={() => move(index, -1)} disabled={reordering || index === 0} title="Move up">
+                <FaArrowUp />
+              </button>
+              <button className="btn-secondary" onClick={() => move(index, 1)} disabled={reordering || index === links.length - 1} title="Move down">
+                <FaArrowDown />
+              </button>
               <button className="btn-secondary" onClick={() => {
                 setEditing(item);
                 setForm({
@@ -1,9 +1,10 @@
 import { useState, useEffect } from 'react';
-import { getStack, adminCreateStack, adminUpdateStack, adminDeleteStack } from '../../../services/api';
-import { FaEdit, FaTrash } from 'react-icons/fa';
+import { getStack, adminCreateStack, adminUpdateStack, adminDeleteStack, adminReorderStack } from '../../../services/api';
+import { FaEdit, FaTrash, FaArrowUp, FaArrowDown } from 'react-icons/fa';
 import Toast from '../../../components/Toast';
 import ImagePreview from '../../../components/ImagePreview';
 import LoadingSpinner from '../../../components/LoadingSpinner';
+import { useReorder } from '../../../hooks/useReorder';
 
 const StackManager = ({ onUpdate }) => {
   const [stack, setStack] = useState([]);
@@ -41,6 +42,13 @@ const StackManager = ({ onUpdate }) => {
     }
   };
 
+  const { move, reordering } = useReorder(stack, setStack, {
+    save: adminReorderStack,
+    reload: loadStack,
+    onUpdate,
+    onError: () => showToast('Failed to reorder tech stack', 'error'),
+  });
+
   const handleSubmit = async (e) => {
     e.preventDefault();
     setLoading(true);
@@ -127,7 +135,7 @@ const StackManager = ({ onUpdate }) => {
         </div>
       ) : (
         <div className="item-list">
-          {stack.map((item) => (
+          {stack.map((item, index) => (
             <div key={item.id} className="item-card">
               <div>
                 <h3>{item.name}</h3>
@@ -135,6 +143,12 @@ const StackManager = ({ onUpdate }) => {
                 {item.proficiency != null && <p>Proficiency: {item.proficiency}%</p>}
               </div>
               <div className="item-actions">
+                <button className="btn-secondary" onClick={() => move(index, -1)} disabled={loading || reordering || index === 0} title="Move up">
+                  <FaArrowUp />
+                </button>
+                <button className="btn-secondary" onClick={() => move(index, 1)} disabled={loading || reordering || index === stack.length - 1} title="Move down">
+                  <FaArrowDown />
+                </button>
                 <button className="btn-secondary" onClick={() => handleEdit(item)} disabled={loading}>
                   <FaEdit />
                 </button>
@@ -11,6 +11,7 @@ const api = axios.create({
 });
 
 // Public API calls
+export const getPortfolio = () => api.get('/api/portfolio');
 export const getAbout = () => api.get('/api/about');
 export const getStack = () => api.get('/api/stack');
 export const getProjects = (featured = false) => 
@@ -52,26 +53,31 @@ export const adminCreateAbout = (data) => api.post('/api/admin/about', data);
 export const adminCreateStack = (data) => api.post('/api/admin/stack', data);
 export const adminUpdateStack = (id, data) => api.put(`/api/admin/stack/${id}`, data);
 export const adminDeleteStack = (id) => api.delete(`/api/admin/stack/${id}`);
+export const adminReorderStack = (ids) => api.post('/api/admin/stack/reorder', { ids });
 
 // Admin CRUD - Projects
 export const adminCreateProject = (data) => api.post('/api/admin/projects', data);
 export const adminUpdateProject = (id, data) => api.put(`/api/admin/projects/${id}`, data);
 export const adminDeleteProject = (id) => api.delete(`/api/admin/projects/${id}`);
+export const adminReorderProjects = (ids) => api.post('/api/admin/projects/reorder', { ids });
 
 // Admin CRUD - Experience
 export const adminCreateExperience = (data) => api.post('/api/admin/experience', data);
 export const adminUpdateExperience = (id, data) => api.put(`/api/admin/experience/${id}`, data);
 export const adminDeleteExperience = (id) => api.delete(`/api/admin/experience/${id}`);
+export const adminReorderExperience = (ids) => api.post('/api/admin/experience/reorder', { ids });
 
 // Admin CRUD - Education
 export const adminCreateEducation = (data) => api.post('/api/admin/education', data);
 export const adminUpdateEducation = (id, data) => api.put(`/api/admin/education/${id}`, data);
 export const adminDeleteEducation = (id) => api.delete(`/api/admin/education/${id}`);
+export const adminReorderEducation = (ids) => api.post('/api/admin/education/reorder', { ids });
 
 // Admin CRUD - Social Links
 export const adminCreateSocialLink = (data) => api.post('/api/admin/social-links', data);
 export const adminUpdateSocialLink = (id, data) => api.put(`/api/admin/social-links/${id}`, data);
 export const adminDeleteSocialLink = (id) => api.delete(`/api/admin/social-links/${id}`);
+export const adminReorderSocialLinks = (ids) => api.post('/api/admin/social-links/reorder', { ids });
 
 // Admin - Contacts
 export const adminGetContacts = () => api.get('/api/admin/contacts');
@@ -85,6 +91,7 @@ export const getBlogBySlug = (slug) => api.get(`/api/blogs/${slug}`);
 
 // Admin CRUD - Blog
 export const adminGetBlogs = () => api.get('/api/admin/blogs');
+export const adminGetBlog = (id) => api.get(`/api/admin/blogs/${id}`);
 export const adminCreateBlog = (data) => api.post('/api/admin/blogs', data);
 export const adminUpdateBlog = (id, data) => api.put(`/api/admin/blogs/${id}`, data);
 export const adminDeleteBlog = (id) => api.delete(`/api/admin/blogs/${id}`);